@@ -1,3 +1,6 @@
+import functools
+import itertools
+
 import numpy as np
 import gdspy
 
@@ -27,6 +30,18 @@ class HangerConfiguration:
         self.coupler_gap = coupler_gap
         self.outer_angle = self.inner_angle + self.gap + self.path_width
 
+    @property
+    def _geom_key(self):
+        """
+        Hashable tuple of every field create_1_hanger reads. Two configs with the same key produce identical paths.
+        The coupler gap only moves the feedline, so it is left out when there is no feedline.
+        """
+        return (self.path_width, self.path3_width, self.gap, self.inner_angle, self.outer_angle,
+                self.length_of_one_segment, self.total_loops, self.padding, self.rotation_angle, tuple(self.layers),
+                self.points, self.x, self.y, self.first_seg_length, self.coupler_length, self.want_feedline_and_pads,
+                self.feedline_extend_length, self.feedline_width, self.feedline_path_width,
+                self.coupler_gap if self.want_feedline_and_pads else None)
+
 class HangerArrayConfiguration:
     def __init__(self, config, num_hangers_bottom, num_hangers_top, distance_between_meanders=100, feedline_width=50, feedline_path_width=15, feedline_extend_length=100, x_dist_pad_from_feedline=100):
         if isinstance(config, list):
@@ -77,9 +92,11 @@ class TransmissionConfiguration:
 
 class HoleConfiguration:
     def __init__(self, radius=5, x_min=None, x_max=None, y_min=None, y_max=None, path1=None, path2=None, path3s=None,
-                write_area=None):
+                write_area=None, hole_points=None, merge_holes=False):
         
         self.radius = radius
+        self.hole_points = hole_points
+        self.merge_holes = merge_holes
         self.x_min = x_min
         self.x_max = x_max
         self.y_min = y_min
@@ -90,6 +107,38 @@ class HoleConfiguration:
         self.write_area = write_area
         self.hole_periods = []
 
+def _bbox(polygons):
+    """
+    Bounding box of a list of (N, 2) vertex arrays, e.g. the polygons of a gdspy object.
+
+    Returns:
+        tuple: Two arrays, (x_min, y_min) and (x_max, y_max).
+    """
+    all_vertices = np.concatenate(polygons, axis=0)
+    return all_vertices.min(axis=0), all_vertices.max(axis=0)
+
+# Corner selector for an axis-aligned rectangle: False picks the low coordinate, True the high one.
+# The rows give the lower left, lower right, upper right and upper left corners.
+_RECT_CORNERS = np.array([[False, False], [True, False], [True, True], [False, True]])
+
+def _feedline_rects(x_min, x_max, y_start, feedline_path_width, feedline_width):
+    """
+    Vertices of the lower and upper feedline rectangles, stacked bottom to top.
+
+    Parameters:
+        x_min, x_max (float): Horizontal extent of both rectangles.
+        y_start (float): Bottom edge of the lower rectangle.
+        feedline_path_width (float): Height of each rectangle.
+        feedline_width (float): Gap between the two rectangles.
+
+    Returns:
+        np.ndarray: Array of shape (2, 4, 2) with the corners of each rectangle.
+    """
+    y_low = y_start + np.array([0, feedline_path_width + feedline_width])
+    lows = np.stack([np.full(2, x_min), y_low], axis=-1)[:, None, :]
+    highs = np.stack([np.full(2, x_max), y_low + feedline_path_width], axis=-1)[:, None, :]
+    return np.where(_RECT_CORNERS, highs, lows)
+
 def create_1_transmission(meander_config, hole_config=None):
     
     """
@@ -139,73 +188,80 @@ def create_1_transmission(meander_config, hole_config=None):
     path2 = gdspy.Path(path_width, (path_width + gap, 0))
     path3 = gdspy.Path(path3_width, ((path_width + gap) / 2, (-padding)))
 
-    path1.segment(40, "+y", layer=layers[0])
-    path1.turn(outer_angle, "r", number_of_points=points, layer=layers[0])
-    path1.segment(first_seg_length , "+x", layer=layers[0])
-    path1.turn(inner_angle, "ll", number_of_points=points, layer=layers[0])
-    path1.segment(length_of_one_segment, "-x", layer=layers[0])
-    path1.turn(outer_angle, "rr", number_of_points=points, layer=layers[0])
+    seg1, turn1 = path1.segment, path1.turn
+    seg2, turn2 = path2.segment, path2.turn
+    seg3, turn3 = path3.segment, path3.turn
+    layer0, layer1 = layers[0], layers[1]
+    kw0 = dict(number_of_points=points, layer=layer0)
+    path3_angle = (inner_angle + outer_angle) / 2
+
+    seg1(40, "+y", layer=layer0)
+    turn1(outer_angle, "r", **kw0)
+    seg1(first_seg_length , "+x", layer=layer0)
+    turn1(inner_angle, "ll", **kw0)
+    seg1(length_of_one_segment, "-x", layer=layer0)
+    turn1(outer_angle, "rr", **kw0)
     for i in range(loops_after_one):
-        path1.segment(length_of_one_segment, "+x", layer=layers[0])
-        path1.turn(inner_angle, "ll", number_of_points=points, layer=layers[0])
-        path1.segment(length_of_one_segment, "-x", layer=layers[0])
-        path1.turn(outer_angle, "rr", number_of_points=points)
-    path1.segment(length_of_one_segment, "+x", layer=layers[0])
-    path1.turn(inner_angle, "ll", number_of_points=points, layer=layers[0])
-    path1.segment(last_seg_length, "-x", layer=layers[0])
-    path1.turn(outer_angle, "r", number_of_points=points, layer=layers[0])
-    path1.segment(40, "+y", layer=layers[0])
-
-    path2.segment(40, "+y", layer=layers[0])
-    path2.turn(inner_angle, "r", number_of_points=points, layer=layers[0])
-    path2.segment(first_seg_length, "+x", layer=layers[0])
-    path2.turn(outer_angle, "ll", number_of_points=points, layer=layers[0])
-    path2.segment(length_of_one_segment, "-x", layer=layers[0])
-    path2.turn(inner_angle, "rr", number_of_points=points, layer=layers[0])
+        seg1(length_of_one_segment, "+x", layer=layer0)
+        turn1(inner_angle, "ll", **kw0)
+        seg1(length_of_one_segment, "-x", layer=layer0)
+        turn1(outer_angle, "rr", **kw0)
+    seg1(length_of_one_segment, "+x", layer=layer0)
+    turn1(inner_angle, "ll", **kw0)
+    seg1(last_seg_length, "-x", layer=layer0)
+    turn1(outer_angle, "r", **kw0)
+    seg1(40, "+y", layer=layer0)
+
+    seg2(40, "+y", layer=layer0)
+    turn2(inner_angle, "r", **kw0)
+    seg2(first_seg_length, "+x", layer=layer0)
+    turn2(outer_angle, "ll", **kw0)
+    seg2(length_of_one_segment, "-x", layer=layer0)
+    turn2(inner_angle, "rr", **kw0)
     for i in range(loops_after_one):
-        path2.segment(length_of_one_segment, "+x", layer=layers[0])
-        path2.turn(outer_angle, "ll", number_of_points=points, layer=layers[0])
-        path2.segment(length_of_one_segment, "-x", layer=layers[0])
-        path2.turn(inner_angle, "rr", number_of_points=points, layer=layers[0])
-    path2.segment(length_of_one_segment, "+x", layer=layers[0])
-    path2.turn(outer_angle, "ll", number_of_points=points, layer=layers[0])
-    path2.segment(last_seg_length, "-x", layer=layers[0])
-    path2.turn(inner_angle, "r", number_of_points=points, layer=layers[0])
-    path2.segment(40, "+y", layer=layers[0])
-
-    path3.segment(padding + 40, "+y", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "r", layer=layers[1])
-    path3.segment(first_seg_length, "+x", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "ll", layer=layers[1])
-    path3.segment(length_of_one_segment, "-x", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "rr", layer=layers[1])
+        seg2(length_of_one_segment, "+x", layer=layer0)
+        turn2(outer_angle, "ll", **kw0)
+        seg2(length_of_one_segment, "-x", layer=layer0)
+        turn2(inner_angle, "rr", **kw0)
+    seg2(length_of_one_segment, "+x", layer=layer0)
+    turn2(outer_angle, "ll", **kw0)
+    seg2(last_seg_length, "-x", layer=layer0)
+    turn2(inner_angle, "r", **kw0)
+    seg2(40, "+y", layer=layer0)
+
+    seg3(padding + 40, "+y", layer=layer1)
+    turn3(path3_angle, "r", layer=layer1)
+    seg3(first_seg_length, "+x", layer=layer1)
+    turn3(path3_angle, "ll", layer=layer1)
+    seg3(length_of_one_segment, "-x", layer=layer1)
+    turn3(path3_angle, "rr", layer=layer1)
     for i in range(loops_after_one):
-        path3.segment(length_of_one_segment, "+x", layer=layers[1])
-        path3.turn((inner_angle + outer_angle) / 2, "ll", layer=layers[1])
-        path3.segment(length_of_one_segment, "-x", layer=layers[1])
-        path3.turn((inner_angle + outer_angle) / 2, "rr", layer=layers[1])
-    path3.segment(length_of_one_segment, "+x", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "ll", layer=layers[1])
-    path3.segment(last_seg_length, "-x", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "r", layer=layers[1])
-    path3.segment(padding + 40, "+y", layer=layers[1])
+        seg3(length_of_one_segment, "+x", layer=layer1)
+        turn3(path3_angle, "ll", layer=layer1)
+        seg3(length_of_one_segment, "-x", layer=layer1)
+        turn3(path3_angle, "rr", layer=layer1)
+    seg3(length_of_one_segment, "+x", layer=layer1)
+    turn3(path3_angle, "ll", layer=layer1)
+    seg3(last_seg_length, "-x", layer=layer1)
+    turn3(path3_angle, "r", layer=layer1)
+    seg3(padding + 40, "+y", layer=layer1)
 
     if want_touch_pads:
         pad1 = make_touch_pad_for_transmission_resonator(path1, path2, '+y')
         pad2 = make_touch_pad_for_transmission_resonator(path1, path2, '-y')
         
-        all_vertices_pad3 = np.vstack(pad1.polygons)
-        points = [[np.min(all_vertices_pad3[:, 0]) - padding, np.min(all_vertices_pad3[:, 1]) - padding], 
-                  [np.min(all_vertices_pad3[:, 0]) - padding, np.max(all_vertices_pad3[:, 1]) + padding],
-                  [np.max(all_vertices_pad3[:, 0]) + padding, np.max(all_vertices_pad3[:, 1]) + padding],
-                  [np.max(all_vertices_pad3[:, 0]) + padding, np.min(all_vertices_pad3[:, 1]) - padding]]
+        (pad3_x_min, pad3_y_min), (pad3_x_max, pad3_y_max) = _bbox(pad1.polygons)
+        points = [[pad3_x_min - padding, pad3_y_min - padding], 
+                  [pad3_x_min - padding, pad3_y_max + padding],
+                  [pad3_x_max + padding, pad3_y_max + padding],
+                  [pad3_x_max + padding, pad3_y_min - padding]]
         pad3 = gdspy.Polygon(points=points, layer=1)
         
-        all_vertices_pad4 = np.vstack(pad2.polygons)
-        points = [[np.min(all_vertices_pad4[:, 0]) - padding, np.min(all_vertices_pad4[:, 1]) - padding], 
-                  [np.min(all_vertices_pad4[:, 0]) - padding, np.max(all_vertices_pad4[:, 1]) + padding],
-                  [np.max(all_vertices_pad4[:, 0]) + padding, np.max(all_vertices_pad4[:, 1]) + padding], 
-                  [np.max(all_vertices_pad4[:, 0]) + padding, np.min(all_vertices_pad4[:, 1]) - padding]]
+        (pad4_x_min, pad4_y_min), (pad4_x_max, pad4_y_max) = _bbox(pad2.polygons)
+        points = [[pad4_x_min - padding, pad4_y_min - padding], 
+                  [pad4_x_min - padding, pad4_y_max + padding],
+                  [pad4_x_max + padding, pad4_y_max + padding], 
+                  [pad4_x_max + padding, pad4_y_min - padding]]
         pad4 = gdspy.Polygon(points=points, layer=1)
 
         path1.rotate(rotation_angle, center=(x, y))
@@ -225,27 +281,27 @@ def create_1_transmission(meander_config, hole_config=None):
         
     if want_holes:
         
-        all_vertices = np.vstack(path3.polygons)
+        (path3_x_min, path3_y_min), (path3_x_max, path3_y_max) = _bbox(path3.polygons)
         
         if not want_touch_pads:
             if hole_config.x_min is None:
-                hole_config.x_min = int(np.min(all_vertices[:, 0]))
+                hole_config.x_min = int(path3_x_min)
             if hole_config.x_max is None:
-                hole_config.x_max = int(np.max(all_vertices[:, 0]))
+                hole_config.x_max = int(path3_x_max)
             if hole_config.y_min is None:
-                hole_config.y_min = int(np.min(all_vertices[:, 1]))
+                hole_config.y_min = int(path3_y_min)
             if hole_config.y_max is None:
-                hole_config.y_max = int(np.max(all_vertices[:, 1]))
+                hole_config.y_max = int(path3_y_max)
         
         elif want_touch_pads:
             if hole_config.x_min is None:
-                hole_config.x_min = int(np.min(all_vertices[:, 0]))
+                hole_config.x_min = int(path3_x_min)
             if hole_config.x_max is None:
-                hole_config.x_max = int(np.max(all_vertices[:, 0]))
+                hole_config.x_max = int(path3_x_max)
             if hole_config.y_min is None:
-                hole_config.y_min = int(np.min(all_vertices_pad3[:, 1]))
+                hole_config.y_min = int(pad3_y_min)
             if hole_config.y_max is None:
-                hole_config.y_max = int(np.max(all_vertices_pad4[:, 1]))
+                hole_config.y_max = int(pad4_y_max)
             
         hole_config.path1 = path1
         hole_config.path2 = path2
@@ -317,60 +373,59 @@ def create_1_hanger(config):
     path2 = gdspy.Path(path_width, (0, 0))
     path3 = gdspy.Path(path3_width, (-padding, (path_width + gap) / 2))
 
-    path1.segment(first_seg_length, "+x", layer=layers[0])
-    path1.turn(inner_angle, "ll", number_of_points=points, layer=layers[0])
-    path1.segment(length_of_one_segment, "-x", layer=layers[0])
-    path1.turn(outer_angle, "rr", number_of_points=points, layer=layers[0])
+    seg1, turn1 = path1.segment, path1.turn
+    seg2, turn2 = path2.segment, path2.turn
+    seg3, turn3 = path3.segment, path3.turn
+    layer0, layer1 = layers[0], layers[1]
+    kw0 = dict(number_of_points=points, layer=layer0)
+    path3_angle = (inner_angle + outer_angle) / 2
+
+    seg1(first_seg_length, "+x", layer=layer0)
+    turn1(inner_angle, "ll", **kw0)
+    seg1(length_of_one_segment, "-x", layer=layer0)
+    turn1(outer_angle, "rr", **kw0)
     for i in range(loops_after_one):
-        path1.segment(length_of_one_segment, "+x", layer=layers[0])
-        path1.turn(inner_angle, "ll", number_of_points=points, layer=layers[0])
-        path1.segment(length_of_one_segment, "-x", layer=layers[0])
-        path1.turn(outer_angle, "rr", number_of_points=points)
-    path1.segment(length_of_one_segment, "+x", layer=layers[0])
-    path1.turn(inner_angle, "ll", number_of_points=points, layer=layers[0])
-    path1.segment(coupler_length, "-x", layer=layers[0])
-    path1.turn((gap + path_width) / 2, "rr", number_of_points=points, layer=layers[0])
-
-    path2.segment(first_seg_length, "+x", layer=layers[0])
-    path2.turn(outer_angle, "ll", number_of_points=points, layer=layers[0])
-    path2.segment(length_of_one_segment, "-x", layer=layers[0])
-    path2.turn(inner_angle, "rr", number_of_points=points, layer=layers[0])
+        seg1(length_of_one_segment, "+x", layer=layer0)
+        turn1(inner_angle, "ll", **kw0)
+        seg1(length_of_one_segment, "-x", layer=layer0)
+        turn1(outer_angle, "rr", **kw0)
+    seg1(length_of_one_segment, "+x", layer=layer0)
+    turn1(inner_angle, "ll", **kw0)
+    seg1(coupler_length, "-x", layer=layer0)
+    turn1((gap + path_width) / 2, "rr", **kw0)
+
+    seg2(first_seg_length, "+x", layer=layer0)
+    turn2(outer_angle, "ll", **kw0)
+    seg2(length_of_one_segment, "-x", layer=layer0)
+    turn2(inner_angle, "rr", **kw0)
     for i in range(loops_after_one):
-        path2.segment(length_of_one_segment, "+x", layer=layers[0])
-        path2.turn(outer_angle, "ll", number_of_points=points, layer=layers[0])
-        path2.segment(length_of_one_segment, "-x", layer=layers[0])
-        path2.turn(inner_angle, "rr", number_of_points=points, layer=layers[0])
-    path2.segment(length_of_one_segment, "+x", layer=layers[0])
-    path2.turn(outer_angle, "ll", number_of_points=points, layer=layers[0])
-    path2.segment(coupler_length, "-x", layer=layers[0])
-
-    path3.segment(first_seg_length + padding, "+x", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "ll", layer=layers[1])
-    path3.segment(length_of_one_segment, "-x", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "rr", layer=layers[1])
+        seg2(length_of_one_segment, "+x", layer=layer0)
+        turn2(outer_angle, "ll", **kw0)
+        seg2(length_of_one_segment, "-x", layer=layer0)
+        turn2(inner_angle, "rr", **kw0)
+    seg2(length_of_one_segment, "+x", layer=layer0)
+    turn2(outer_angle, "ll", **kw0)
+    seg2(coupler_length, "-x", layer=layer0)
+
+    seg3(first_seg_length + padding, "+x", layer=layer1)
+    turn3(path3_angle, "ll", layer=layer1)
+    seg3(length_of_one_segment, "-x", layer=layer1)
+    turn3(path3_angle, "rr", layer=layer1)
     for i in range(loops_after_one):
-        path3.segment(length_of_one_segment, "+x", layer=layers[1])
-        path3.turn((inner_angle + outer_angle) / 2, "ll", layer=layers[1])
-        path3.segment(length_of_one_segment, "-x", layer=layers[1])
-        path3.turn((inner_angle + outer_angle) / 2, "rr", layer=layers[1])
-    path3.segment(length_of_one_segment, "+x", layer=layers[1])
-    path3.turn((inner_angle + outer_angle) / 2, "ll", layer=layers[1])
-    path3.segment(coupler_length + (path_width + gap) / 2 + padding, "-x", layer=layers[1])
+        seg3(length_of_one_segment, "+x", layer=layer1)
+        turn3(path3_angle, "ll", layer=layer1)
+        seg3(length_of_one_segment, "-x", layer=layer1)
+        turn3(path3_angle, "rr", layer=layer1)
+    seg3(length_of_one_segment, "+x", layer=layer1)
+    turn3(path3_angle, "ll", layer=layer1)
+    seg3(coupler_length + (path_width + gap) / 2 + padding, "-x", layer=layer1)
 
     if want_feedline_and_pads:
-        y_max = np.max(path2.polygons[-1][:, 1])
-        x_max = np.max(path2.polygons[-1][:, 0])
-        x_min = np.min(path2.polygons[-1][:, 0])
+        last = path2.polygons[-1]
+        x_min, x_max, y_max = last[:, 0].min(), last[:, 0].max(), last[:, 1].max()
         
-        points_feedline_lower = [[x_min - feedline_extend_length, y_max + coupler_gap], 
-                                 [x_max + feedline_extend_length, y_max + coupler_gap],
-                                 [x_max + feedline_extend_length, y_max + coupler_gap + feedline_path_width],
-                                 [x_min - feedline_extend_length, y_max + coupler_gap + feedline_path_width]]
-
-        points_feedline_upper = [[x_min - feedline_extend_length, y_max + coupler_gap + feedline_width + feedline_path_width], 
-                                 [x_max + feedline_extend_length, y_max + coupler_gap + feedline_width + feedline_path_width],
-                                 [x_max + feedline_extend_length, y_max + coupler_gap + feedline_path_width + feedline_width + feedline_path_width],
-                                 [x_min - feedline_extend_length, y_max + coupler_gap + feedline_path_width + feedline_width + feedline_path_width]]
+        points_feedline_lower, points_feedline_upper = _feedline_rects(x_min - feedline_extend_length, x_max + feedline_extend_length, 
+                                                                       y_max + coupler_gap, feedline_path_width, feedline_width)
         
         feedline_lower = gdspy.Polygon(points_feedline_lower)
         feedline_upper = gdspy.Polygon(points_feedline_upper)
@@ -392,6 +447,23 @@ def create_1_hanger(config):
 
         return all_objs
     
+def _cached_hanger(config, cache):
+    """
+    Same as create_1_hanger(config), but reuses the paths of an identical config stored in cache.
+    Always returns copies, so the caller is free to translate them.
+
+    Returns:
+        tuple: The three paths and the untranslated x extents (path1 x_min, path2 x_min, path2 x_max).
+    """
+    key = config._geom_key
+    if key not in cache:
+        paths = create_1_hanger(config)
+        (path1_x_min, _), _ = _bbox(paths[0].polygons)
+        (path2_x_min, _), (path2_x_max, _) = _bbox(paths[1].polygons)
+        cache[key] = paths, (path1_x_min, path2_x_min, path2_x_max)
+    paths, extents = cache[key]
+    return tuple(gdspy.copy(path) for path in paths), extents
+
 def create_hangers_array(super_config, hole_config=None):
     
     want_holes = hole_config is not None
@@ -412,30 +484,27 @@ def create_hangers_array(super_config, hole_config=None):
     pads = []
     masks = []
     
-    width_of_paths = []
-    all_coupler_gaps1 = [config.coupler_gap for config in configs[0]]
-    x_extreme_points = []
+    width_of_paths = np.empty(num_reson_bottom + num_reson_top, dtype=np.float64)
+    all_coupler_gaps1 = np.fromiter((config.coupler_gap for config in configs[0]), dtype=np.float64, count=num_reson_bottom)
+    x_extreme_points = np.empty((num_reson_bottom + num_reson_top, 2), dtype=np.float64)
     
     all_holes = []
     
+    # Arrays usually repeat the same config, so each distinct hanger is only tessellated once.
+    hanger_cache = {}
+    
+    width = 0
     for i in range(num_reson_bottom):
                 
         config = configs[0][i]
         
-        path1, path2, path3 = create_1_hanger(config)
-
-        all_vertices = np.vstack(path2.polygons)
-        x_coordinates = all_vertices[:, 0]
-        max_x = np.max(x_coordinates)
+        (path1, path2, path3), (min_x, path2_x_min, max_x) = _cached_hanger(config, hanger_cache)
         
-        all_vertices = np.vstack(path1.polygons)
-        x_coordinates = all_vertices[:, 0]
-        min_x = np.min(x_coordinates)
-        
-        width_of_paths.append((np.abs(max_x) + np.abs(min_x)))
+        width_of_paths[i] = max_x - min_x
         
+        dx = 0
         if i != 0:
-            width = sum(width_of_paths[0 : i])
+            width += width_of_paths[i - 1]
             dx = width + distance_between_meanders * i
             dy = all_coupler_gaps1[0] - all_coupler_gaps1[i]
             for path in [path1, path2, path3]:
@@ -443,12 +512,10 @@ def create_hangers_array(super_config, hole_config=None):
                 
         elif i == 0:
             coupler_gap = all_coupler_gaps1[0] - feedline_path_width - config.path_width
-            y_max = np.max(path2.polygons[-1][:, 1])
+            y_max = path2.polygons[-1][:, 1].max()
         
-        x_max = np.max(path2.polygons[-1][:, 0])
-        x_min = np.min(path2.polygons[-1][:, 0])
-        x_extreme_points.append(x_max)
-        x_extreme_points.append(x_min)
+        # Translation shifts every vertex by dx, so the cached extents only need the same shift.
+        x_extreme_points[i] = path2_x_min + dx, max_x + dx
 
         path1s_left.append(path1)
         path2s_left.append(path2)
@@ -456,12 +523,12 @@ def create_hangers_array(super_config, hole_config=None):
     
         if want_holes:
         
-            all_vertices = np.vstack(path3.polygons)
+            (path3_x_min, path3_y_min), (path3_x_max, path3_y_max) = _bbox(path3.polygons)
 
-            hole_config.x_min = int(np.min(all_vertices[:, 0]))
-            hole_config.x_max = int(np.max(all_vertices[:, 0]))
-            hole_config.y_min = int(np.min(all_vertices[:, 1]))
-            hole_config.y_max = int(np.max(all_vertices[:, 1]))
+            hole_config.x_min = int(path3_x_min)
+            hole_config.x_max = int(path3_x_max)
+            hole_config.y_min = int(path3_y_min)
+            hole_config.y_max = int(path3_y_max)
             
             points_meander_mask = [[hole_config.x_min, hole_config.y_min], [hole_config.x_min, hole_config.y_max], 
                                    [hole_config.x_max, hole_config.y_max], [hole_config.x_max, hole_config.y_min]]
@@ -477,28 +544,22 @@ def create_hangers_array(super_config, hole_config=None):
     
             all_holes.append(holes)
     
-    all_coupler_gaps2 = [config.coupler_gap for config in configs[1]]
+    all_coupler_gaps2 = np.fromiter((config.coupler_gap for config in configs[1]), dtype=np.float64, count=num_reson_top)
+    
+    # The top row is placed relative to the first bottom hanger, whose extent doesn't change inside the loop.
+    (_, first_min_y), (first_max_x, first_max_y) = _bbox(path2s_left[0].polygons)
+    height_of_resonator = first_max_y - first_min_y
+    
+    width = 0
     for i in range(num_reson_top):
         config = configs[1][i]
         
-        path1, path2, path3 = create_1_hanger(config)
-
-        all_vertices = np.vstack(path2s_left[0].polygons)
-        x_coordinates = all_vertices[:, 0]
-        max_x = np.max(x_coordinates)
-        y_coordinates = all_vertices[:, 1]
-        max_y = np.max(y_coordinates)
-        min_y = np.min(y_coordinates)
-        height_of_resonator = max_y - min_y
-        
-        all_vertices = np.vstack(path1.polygons)
-        x_coordinates = all_vertices[:, 0]
-        min_x = np.min(x_coordinates)
+        (path1, path2, path3), (min_x, path2_x_min, path2_x_max) = _cached_hanger(config, hanger_cache)
         
-        width_of_paths.append(max_x - min_x)
+        width_of_paths[num_reson_bottom + i] = first_max_x - min_x
         
         if i != 0:
-            width = sum(width_of_paths[0 : i])
+            width += width_of_paths[i - 1]
             dx = width + distance_between_meanders * i
             dy = height_of_resonator + 1 * all_coupler_gaps1[0] + all_coupler_gaps2[i] - 2 * config.path_width + feedline_width
             for path in [path1, path2, path3]:
@@ -510,18 +571,20 @@ def create_hangers_array(super_config, hole_config=None):
             for path in [path1, path2, path3]:
                 path.translate(dx, dy)
 
+        x_extreme_points[num_reson_bottom + i] = path2_x_min + dx, path2_x_max + dx
+
         path1s_left.append(path1)
         path2s_left.append(path2)
         path3s_left.append(path3)
         
         if want_holes:
         
-            all_vertices = np.vstack(path3.polygons)
+            (path3_x_min, path3_y_min), (path3_x_max, path3_y_max) = _bbox(path3.polygons)
 
-            hole_config.x_min = int(np.min(all_vertices[:, 0]))
-            hole_config.x_max = int(np.max(all_vertices[:, 0]))
-            hole_config.y_min = int(np.min(all_vertices[:, 1]))
-            hole_config.y_max = int(np.max(all_vertices[:, 1]))
+            hole_config.x_min = int(path3_x_min)
+            hole_config.x_max = int(path3_x_max)
+            hole_config.y_min = int(path3_y_min)
+            hole_config.y_max = int(path3_y_max)
             
             points_meander_mask = [[hole_config.x_min, hole_config.y_min], [hole_config.x_min, hole_config.y_max], 
                                    [hole_config.x_max, hole_config.y_max], [hole_config.x_max, hole_config.y_min]]
@@ -537,54 +600,23 @@ def create_hangers_array(super_config, hole_config=None):
     
             all_holes.append(holes)
     
-    x_extreme_points = []
-    
-    for paths in [path1s_left, path2s_left]:
-        for i in range(len(paths)):
-            all_vertices = np.vstack(path2s_left[i].polygons)
-            x_coordinates = all_vertices[:, 0]
-            max_x = np.max(x_coordinates)
-            min_x = np.min(x_coordinates)
-
-            x_extreme_points.append(min_x)
-            x_extreme_points.append(max_x)
-    
-    x_min = np.min(x_extreme_points)
-    x_max = np.max(x_extreme_points)
-    points_feedline_lower = [[x_min - feedline_extend_length, y_max + coupler_gap], 
-                             [x_max + feedline_extend_length, y_max + coupler_gap],
-                             [x_max + feedline_extend_length, y_max + coupler_gap + feedline_path_width],
-                             [x_min - feedline_extend_length, y_max + coupler_gap + feedline_path_width]]
-
-    points_feedline_upper = [[x_min - feedline_extend_length, y_max + coupler_gap + feedline_width + feedline_path_width], 
-                             [x_max + feedline_extend_length, y_max + coupler_gap + feedline_width + feedline_path_width],
-                             [x_max + feedline_extend_length, y_max + coupler_gap + feedline_path_width + feedline_width + feedline_path_width],
-                             [x_min - feedline_extend_length, y_max + coupler_gap + feedline_path_width + feedline_width + feedline_path_width]]
+    x_min = x_extreme_points.min()
+    x_max = x_extreme_points.max()
+    points_feedline_lower, points_feedline_upper = _feedline_rects(x_min - feedline_extend_length, x_max + feedline_extend_length, 
+                                                                   y_max + coupler_gap, feedline_path_width, feedline_width)
     feedline_lower = gdspy.Polygon(points_feedline_lower)
     feedline_upper = gdspy.Polygon(points_feedline_upper)
     feedlines.append(feedline_lower)
     feedlines.append(feedline_upper)
     
-    feedline_mask_lower = gdspy.Polygon(points_feedline_lower)
-    feedline_mask_upper = gdspy.Polygon(points_feedline_upper)
-    
     pad1 = make_touch_pad_for_feedline(feedline_lower, feedline_upper, "l", length_of_pad=200, width_of_pad=200, thickness_of_pad=50, x_dist_pad_from_feedline=x_dist_pad_from_feedline)
     pad2 = make_touch_pad_for_feedline(feedline_lower, feedline_upper, "r", length_of_pad=200, width_of_pad=200, thickness_of_pad=50, x_dist_pad_from_feedline=x_dist_pad_from_feedline)
     pads.append(pad1)
     pads.append(pad2)
     
-    pad1_mask = make_touch_pad_for_feedline(feedline_lower, feedline_upper, "l", length_of_pad=200, width_of_pad=200, thickness_of_pad=50, x_dist_pad_from_feedline=x_dist_pad_from_feedline)
-    pad2_mask = make_touch_pad_for_feedline(feedline_lower, feedline_upper, "r", length_of_pad=200, width_of_pad=200, thickness_of_pad=50, x_dist_pad_from_feedline=x_dist_pad_from_feedline)
-    
-    merged_mask = gdspy.boolean([feedline_mask_lower, feedline_mask_upper], [pad1_mask, pad2_mask], "or")
-    
-    all_vertices = np.vstack(merged_mask.polygons)
-    x_coordinates = all_vertices[:, 0]
-    y_coordinates = all_vertices[:, 1]
-    min_x = np.min(x_coordinates)
-    max_x = np.max(x_coordinates)
-    min_y = np.min(y_coordinates)
-    max_y = np.max(y_coordinates)
+    # The mask only needs the bounding box of the feedlines and pads, and the box of a union is the box of its parts,
+    # so no boolean is needed.
+    (min_x, min_y), (max_x, max_y) = _bbox(feedline_lower.polygons + feedline_upper.polygons + pad1.polygons + pad2.polygons)
     
     points_for_feedline_pads_mask = [[min_x - 40, min_y - 40], [min_x - 40, max_y + 40], 
                                      [max_x + 40, max_y + 40], [max_x + 40, min_y - 40]]
@@ -594,6 +626,17 @@ def create_hangers_array(super_config, hole_config=None):
     
     return [path1s_left, path2s_left, path3s_left, feedlines, pads, masks, all_holes]
 
+# Which of the four feedline end vertices (two of poly1, then two of poly2) each of the 13 transmission touch pad
+# vertices is measured from.
+_TRANSMISSION_PAD_CORNER_INDEX = np.array([0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0, 0, 0])
+
+def _feedline_end_corners(poly1, poly2, vertex_index):
+    """
+    The two end vertices of each feedline that a transmission touch pad attaches to, as one (4, 2) array:
+    poly1[vertex_index] followed by poly2[vertex_index].
+    """
+    return np.concatenate([poly1[vertex_index], poly2[vertex_index]])
+
 def make_touch_pad_for_transmission_resonator(feedline_left, feedline_right, direction, length_of_pad=200, width_of_pad=200, thickness_of_pad=50):
     
     """
@@ -617,124 +660,159 @@ def make_touch_pad_for_transmission_resonator(feedline_left, feedline_right, dir
 
     if direction == "+y":
         
-        poly1 = feedline_left.polygons[0]
-        poly2 = feedline_right.polygons[0]
-        
-        feedline_width = np.abs(feedline_left.polygons[0][0][0]) + np.abs(feedline_left.polygons[0][1][0])
+        corners = _feedline_end_corners(feedline_left.polygons[0], feedline_right.polygons[0], [1, 0])
+        feedline_width = abs(corners[0, 0]) + abs(corners[1, 0])
         diff = thickness_of_pad - feedline_width
         x_constant = 95
         y_constant = 75
         
-        points = [poly1[1], poly1[0], poly1[0] - [x_constant + diff, y_constant], 
-                  poly1[0] - [x_constant + diff, y_constant + length_of_pad + thickness_of_pad], 
-                  poly2[1] + [x_constant + diff, -(y_constant + length_of_pad + thickness_of_pad)], 
-                  poly2[1] + [x_constant + diff, -(y_constant)], poly2[1], poly2[0], 
-                  poly2[0] + [x_constant, -(y_constant)], poly2[0] + [x_constant, -(y_constant + length_of_pad)], 
-                  poly1[1] - [x_constant, y_constant + length_of_pad], poly1[1] - [x_constant, y_constant], poly1[1]]
+        x_outer = x_constant + diff
+        y_inner = y_constant + length_of_pad
+        y_outer = y_inner + thickness_of_pad
+        
+        offsets = np.array([[0, 0], [0, 0], [-x_outer, -y_constant], [-x_outer, -y_outer], [x_outer, -y_outer], 
+                            [x_outer, -y_constant], [0, 0], [0, 0], [x_constant, -y_constant], [x_constant, -y_inner], 
+                            [-x_constant, -y_inner], [-x_constant, -y_constant], [0, 0]])
+        points = corners[_TRANSMISSION_PAD_CORNER_INDEX] + offsets
         pad = gdspy.Polygon(points, layer=0)
         
         return pad
     
     if direction == "-y":
         
-        poly1 = feedline_left.polygons[-1]
-        poly2 = feedline_right.polygons[-1]
-        
-        feedline_width = np.abs(feedline_left.polygons[-1][3][0]) + np.abs(feedline_left.polygons[-1][2][0])
+        corners = _feedline_end_corners(feedline_left.polygons[-1], feedline_right.polygons[-1], [2, 3])
+        feedline_width = abs(corners[0, 0]) + abs(corners[1, 0])
         diff = thickness_of_pad - feedline_width
         x_constant = 95
         y_constant = 75 
         
-        points = [poly1[2], poly1[3], poly1[3] - [x_constant + diff, -(y_constant)], 
-                  poly1[3] - [x_constant + diff, -(y_constant + length_of_pad + thickness_of_pad)], 
-                  poly2[2] + [x_constant + diff, (y_constant + length_of_pad + thickness_of_pad)], 
-                  poly2[2] + [x_constant + diff, y_constant], poly2[2], poly2[3], poly2[3] + [x_constant, y_constant], 
-                  poly2[3] + [x_constant, y_constant + width_of_pad], poly1[2] - [x_constant, -(y_constant + width_of_pad)], 
-                  poly1[2] - [x_constant, -(y_constant)], poly1[2]]
+        x_outer = x_constant + diff
+        y_inner = y_constant + width_of_pad
+        y_outer = y_constant + length_of_pad + thickness_of_pad
+        
+        # Mirror image of the "+y" pad, measured from the far end of the feedlines.
+        offsets = np.array([[0, 0], [0, 0], [-x_outer, y_constant], [-x_outer, y_outer], [x_outer, y_outer], 
+                            [x_outer, y_constant], [0, 0], [0, 0], [x_constant, y_constant], [x_constant, y_inner], 
+                            [-x_constant, y_inner], [-x_constant, y_constant], [0, 0]])
+        points = corners[_TRANSMISSION_PAD_CORNER_INDEX] + offsets
         pad = gdspy.Polygon(points, layer=0)
         
         return pad
     
+@functools.lru_cache(maxsize=None)
+def _feedline_pad_x_offsets(length_of_pad, thickness_of_pad, x_dist_pad_from_feedline):
+    """
+    x offsets of the 13 feedline touch pad vertices from the end of the feedline, for a pad pointing in +x.
+    Every pad on a chip has the same dimensions, so this is cached and returned read-only.
+    """
+    near = x_dist_pad_from_feedline
+    inner = near + length_of_pad
+    outer = inner + thickness_of_pad
+    offsets = np.array([0, 0, near, outer, outer, near, 0, 0, near, inner, inner, near, 0], dtype=np.float64)
+    offsets.setflags(write=False)
+    return offsets
+
+# Which of the y levels (lower feedline max/min, outer pad lower/upper edge, upper feedline max/min, inner pad
+# upper/lower edge) each of the 13 pad vertices sits at.
+_FEEDLINE_PAD_Y_INDEX = np.array([0, 1, 2, 2, 3, 3, 4, 5, 6, 6, 7, 7, 0])
+
 def make_touch_pad_for_feedline(feedline_left, feedline_right, direction, length_of_pad=200, width_of_pad=200, 
                                 thickness_of_pad=50, x_dist_pad_from_feedline=100):
     
+    if direction not in ("r", "l"):
+        return None
+    
+    feedline_lower = feedline_left.polygons[0]
+    feedline_higher = feedline_right.polygons[0]
+    
+    (min_x, feedline_lower_min_y), (max_x, feedline_lower_max_y) = feedline_lower.min(axis=0), feedline_lower.max(axis=0)
+    feedline_higher_min_y, feedline_higher_max_y = feedline_higher[:, 1].min(), feedline_higher[:, 1].max()
+    
+    feedline_gap_midpoint = 0.5 * (feedline_higher_min_y + feedline_lower_max_y)
+    
+    pad_inner_higher_edge_y = feedline_gap_midpoint + (width_of_pad / 2)
+    pad_inner_lower_edge_y = feedline_gap_midpoint - (width_of_pad / 2)
+    pad_outer_lower_edge_y = pad_inner_lower_edge_y - thickness_of_pad
+    pad_outer_higher_edge_y = pad_inner_higher_edge_y + thickness_of_pad
+    
+    y_levels = np.array([feedline_lower_max_y, feedline_lower_min_y, pad_outer_lower_edge_y, pad_outer_higher_edge_y, 
+                         feedline_higher_max_y, feedline_higher_min_y, pad_inner_higher_edge_y, pad_inner_lower_edge_y])
+    x_offsets = _feedline_pad_x_offsets(length_of_pad, thickness_of_pad, x_dist_pad_from_feedline)
+    
+    points = np.empty((13, 2))
     if direction == "r":
-        
-        feedline_lower = feedline_left.polygons[0]
-        feedline_higher = feedline_right.polygons[0]
-        
-        feedline_lower_min_y = np.min(feedline_lower[:, 1])
-        feedline_lower_max_y = np.max(feedline_lower[:, 1])
-        feedline_higher_min_y = np.min(feedline_higher[:, 1])
-        feedline_higher_max_y = np.max(feedline_higher[:, 1])
-        max_x = np.max(feedline_lower[:, 0])
-        
-        feedline_path_width = feedline_lower_max_y - feedline_lower_min_y
-        feedline_width = feedline_higher_min_y - feedline_lower_max_y
-        diff = thickness_of_pad - feedline_width
-        feedline_gap_midpoint = np.mean([feedline_higher_min_y, feedline_lower_max_y])
-        
-        pad_inner_higher_edge_y = feedline_gap_midpoint + (width_of_pad / 2)
-        pad_inner_lower_edge_y = feedline_gap_midpoint - (width_of_pad / 2)
-        pad_outer_lower_edge_y = pad_inner_lower_edge_y - thickness_of_pad
-        pad_outer_higher_edge_y = pad_inner_higher_edge_y + thickness_of_pad
-        
-        
-        points = [[max_x, feedline_lower_max_y], 
-                  [max_x, feedline_lower_min_y], 
-                  [max_x + x_dist_pad_from_feedline, pad_outer_lower_edge_y], 
-                  [max_x + x_dist_pad_from_feedline + length_of_pad + thickness_of_pad, pad_outer_lower_edge_y], 
-                  [max_x + x_dist_pad_from_feedline + length_of_pad + thickness_of_pad, pad_outer_higher_edge_y], 
-                  [max_x + x_dist_pad_from_feedline, pad_outer_higher_edge_y], 
-                  [max_x, feedline_higher_max_y], 
-                  [max_x, feedline_higher_min_y], 
-                  [max_x + x_dist_pad_from_feedline, pad_inner_higher_edge_y], 
-                  [max_x + x_dist_pad_from_feedline + length_of_pad, pad_inner_higher_edge_y], 
-                  [max_x + x_dist_pad_from_feedline + length_of_pad, pad_inner_lower_edge_y], 
-                  [max_x + x_dist_pad_from_feedline, pad_inner_lower_edge_y], 
-                  [max_x, feedline_lower_max_y]]
-        pad = gdspy.Polygon(points, layer=0)
-        
-        return pad
+        points[:, 0] = max_x + x_offsets
+    else:
+        points[:, 0] = min_x - x_offsets
+    points[:, 1] = y_levels[_FEEDLINE_PAD_Y_INDEX]
     
-    if direction == "l":
-        
-        feedline_lower = feedline_left.polygons[0]
-        feedline_higher = feedline_right.polygons[0]
-        
-        feedline_lower_min_y = np.min(feedline_lower[:, 1])
-        feedline_lower_max_y = np.max(feedline_lower[:, 1])
-        feedline_higher_min_y = np.min(feedline_higher[:, 1])
-        feedline_higher_max_y = np.max(feedline_higher[:, 1])
-        min_x = np.min(feedline_lower[:, 0])
-        
-        feedline_path_width = feedline_lower_max_y - feedline_lower_min_y
-        feedline_width = feedline_higher_min_y - feedline_lower_max_y
-        diff = thickness_of_pad - feedline_width
-        feedline_gap_midpoint = np.mean([feedline_higher_min_y, feedline_lower_max_y])
-        
-        pad_inner_higher_edge_y = feedline_gap_midpoint + (width_of_pad / 2)
-        pad_inner_lower_edge_y = feedline_gap_midpoint - (width_of_pad / 2)
-        pad_outer_lower_edge_y = pad_inner_lower_edge_y - thickness_of_pad
-        pad_outer_higher_edge_y = pad_inner_higher_edge_y + thickness_of_pad
-                
-        points = [[min_x, feedline_lower_max_y], 
-                  [min_x, feedline_lower_min_y], 
-                  [min_x - x_dist_pad_from_feedline, pad_outer_lower_edge_y], 
-                  [min_x - x_dist_pad_from_feedline - length_of_pad - thickness_of_pad, pad_outer_lower_edge_y], 
-                  [min_x - x_dist_pad_from_feedline - length_of_pad - thickness_of_pad, pad_outer_higher_edge_y], 
-                  [min_x - x_dist_pad_from_feedline, pad_outer_higher_edge_y], 
-                  [min_x, feedline_higher_max_y], 
-                  [min_x, feedline_higher_min_y], 
-                  [min_x - x_dist_pad_from_feedline, pad_inner_higher_edge_y], 
-                  [min_x - x_dist_pad_from_feedline - length_of_pad, pad_inner_higher_edge_y], 
-                  [min_x - x_dist_pad_from_feedline - length_of_pad, pad_inner_lower_edge_y], 
-                  [min_x - x_dist_pad_from_feedline, pad_inner_lower_edge_y], 
-                  [min_x, feedline_lower_max_y]]
-        pad = gdspy.Polygon(points, layer=0)
-        
-        return pad
+    pad = gdspy.Polygon(points, layer=0)
+    
+    return pad
     
+def _filter_holes(x_min, x_max, y_min, y_max, hole_period, radius, path3s, layer, hole_points=None, merge_holes=False):
+    """
+    Places a hole every hole_period on the grid spanned by range(x_min, x_max) and range(y_min, y_max), x outer and
+    y inner, and keeps the ones that don't overlap any of path3s.
+
+    Parameters:
+        x_min, x_max, y_min, y_max (int): Extent of the grid, as for range().
+        hole_period (int): Distance between neighbouring holes.
+        radius (float): Radius of the holes.
+        path3s (list): gdspy objects the holes have to stay clear of.
+        layer (int): Layer of the holes.
+        hole_points (int, optional): Number of vertices per hole. None lets gdspy choose from its default tolerance,
+            which gives 51 vertices for a 5 um hole. Fewer vertices make the overlap test cheaper.
+        merge_holes (bool, optional): Return all kept holes as a single gdspy.PolygonSet instead of one per hole,
+            which is much lighter for large hole counts.
+
+    Returns:
+        list: gdspy.PolygonSet objects, one per hole that was kept, or a single one holding all of them if merge_holes.
+    """
+    xs = np.arange(x_min, x_max, hole_period)
+    ys = np.arange(y_min, y_max, hole_period)
+    X, Y = np.meshgrid(xs, ys, indexing="ij")
+    X, Y = X.ravel(), Y.ravel()
+    centers = np.stack([X, Y], axis=-1)
+    
+    # A hole whose disk misses the bounding boxes of all path3 polygons can't overlap them, so only the rest go through
+    # Clipper. The boxes of the individual segments and turns are much tighter than the box of a whole meander.
+    boxes = np.array([np.concatenate([poly.min(axis=0), poly.max(axis=0)]) 
+                      for path3 in path3s or () for poly in path3.polygons]).reshape(-1, 4)
+    needs_boolean = ((X[:, None] + radius >= boxes[:, 0]) & (X[:, None] - radius <= boxes[:, 2]) &
+                     (Y[:, None] + radius >= boxes[:, 1]) & (Y[:, None] - radius <= boxes[:, 3])).any(axis=1)
+    
+    # Every hole is the same circle, so it is tessellated once and shifted to each center. Hole objects are only built
+    # for the holes that are kept.
+    circle = gdspy.Round(center=(0, 0), radius=radius, number_of_points=hole_points).polygons
+    candidates = np.flatnonzero(needs_boolean)
+    
+    keep = np.ones(len(centers), dtype=bool)
+    if len(candidates):
+        # A hole centred inside a path3 certainly overlaps it, which a point-in-polygon test settles without a boolean.
+        centred_inside = np.array(gdspy.inside([[center] for center in centers[candidates]], path3s))
+        keep[candidates[centred_inside]] = False
+        candidates = candidates[~centred_inside]
+    
+    if len(candidates) and 2 * radius < hole_period:
+        # The holes don't overlap each other, so one boolean against all path3s does for all of them: every piece of
+        # the result lies inside exactly one hole, the one whose grid point is closest to its vertices.
+        overlaps = gdspy.boolean([poly + centers[k] for k in candidates for poly in circle], path3s, "and")
+        if overlaps is not None:
+            first_vertices = np.array([poly[0] for poly in overlaps.polygons])
+            i = np.rint((first_vertices[:, 0] - x_min) / hole_period).astype(int)
+            j = np.rint((first_vertices[:, 1] - y_min) / hole_period).astype(int)
+            keep[i * len(ys) + j] = False
+    else:
+        for k in candidates:
+            hole = [poly + centers[k] for poly in circle]
+            if any(gdspy.boolean(hole, path3, "and") is not None for path3 in path3s):
+                keep[k] = False
+            
+    if merge_holes:
+        return [gdspy.PolygonSet([poly + center for center in centers[keep] for poly in circle], layer=layer)]
+    return [gdspy.PolygonSet([poly + center for poly in circle], layer=layer) for center in centers[keep]]
+
 def create_holes(meander_config, hole_config):
     
     gap = meander_config.gap
@@ -755,62 +833,19 @@ def create_holes(meander_config, hole_config):
 
     hole_config.hole_periods.extend([hole_period])
     
-    poly1 = [poly for poly in list(path1.polygons) if len(poly) == 4][1]
-    poly2 = [poly for poly in list(path2.polygons) if len(poly) == 4][1]
+    # The second straight segment (4 vertices) of each path; the first one is the lead-in.
+    poly1 = next(itertools.islice((poly for poly in path1.polygons if len(poly) == 4), 1, None))
+    poly2 = next(itertools.islice((poly for poly in path2.polygons if len(poly) == 4), 1, None))
     
-    first_loop_y = np.mean([poly1[:, 1], poly2[:, 1]])
-    
-    holes = []
+    # Both segments have 4 vertices, so this is the mean over all 8.
+    first_loop_y = 0.5 * (poly1[:, 1].mean() + poly2[:, 1].mean())
     
     y_min = int(first_loop_y - int(np.abs(y_min - first_loop_y) / hole_period) * hole_period)
     
-    for x in range(x_min, x_max, hole_period):
-        for y in range(y_min, y_max, hole_period):
-            hole = gdspy.Round(center=(x, y), radius=radius, layer=layers[1])
-            holes.append(hole)
-        
-    hole_objs = []
-    
-    for hole in holes:
-        mergeds = []
-        okay = True
-        
-        for path3 in path3s:
-            mergeds.append(gdspy.boolean(hole, path3, "and"))
-            
-        for i in range(len(mergeds)):
-            merged = mergeds[i]
-            if merged is not None:
-                okay = False
-                
-        if okay:
-            hole_objs.append(hole)
-            
-    return hole_objs
+    return _filter_holes(x_min, x_max, y_min, y_max, hole_period, radius, path3s, layers[1], hole_config.hole_points, 
+                         hole_config.merge_holes)
 
-def create_holes_no_meander(x_min, x_max, y_min, y_max, radius=5, hole_period=50, path3s=None, layers=[0, 1]):
+def create_holes_no_meander(x_min, x_max, y_min, y_max, radius=5, hole_period=50, path3s=None, layers=[0, 1], 
+                            hole_points=None, merge_holes=False):
     
-    holes = []
-    for x in range(x_min, x_max, hole_period):
-        for y in range(y_min, y_max, hole_period):
-            hole = gdspy.Round(center=(x, y), radius=radius, layer=layers[1])
-            holes.append(hole)
-        
-    hole_objs = []
-    
-    for hole in holes:
-        mergeds = []
-        okay = True
-        
-        for path3 in path3s:
-            mergeds.append(gdspy.boolean(hole, path3, "and"))
-            
-        for i in range(len(mergeds)):
-            merged = mergeds[i]
-            if merged is not None:
-                okay = False
-                
-        if okay:
-            hole_objs.append(hole)
-            
-    return hole_objs
\ No newline at end of file
+    return _filter_holes(x_min, x_max, y_min, y_max, hole_period, radius, path3s, layers[1], hole_points, merge_holes)
\ No newline at end of file
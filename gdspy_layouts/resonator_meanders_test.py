@@ -0,0 +1,66 @@
+import unittest
+
+import gdspy
+import numpy as np
+
+from . import resonator_meanders as rm
+
+
+def _filter_holes_per_hole(x_min, x_max, y_min, y_max, hole_period, radius, path3s, layer):
+    """The original filter: one boolean per hole and path3."""
+    holes = []
+    for x in range(x_min, x_max, hole_period):
+        for y in range(y_min, y_max, hole_period):
+            hole = gdspy.Round(center=(x, y), radius=radius, layer=layer)
+            if not any(gdspy.boolean(hole, path3, "and") is not None for path3 in path3s):
+                holes.append(hole)
+    return holes
+
+
+class TestFilterHoles(unittest.TestCase):
+    def setUp(self):
+        config = rm.HangerConfiguration(path_width=15, path3_width=95, gap=10, inner_angle=50,
+                                        length_of_one_segment=300, total_loops=2, coupler_length=200,
+                                        coupler_gap=30, rotation_angle=0.3)
+        self.path3s = [rm.create_1_hanger(config)[2]]
+        (x_min, y_min), (x_max, y_max) = rm._bbox(self.path3s[0].polygons)
+        self.extent = int(x_min) - 60, int(x_max) + 60, int(y_min) - 60, int(y_max) + 60
+
+    def assertSameHoles(self, radius, hole_period):
+        x_min, x_max, y_min, y_max = self.extent
+        expected = _filter_holes_per_hole(x_min, x_max, y_min, y_max, hole_period, radius, self.path3s, 1)
+        holes = rm._filter_holes(x_min, x_max, y_min, y_max, hole_period, radius, self.path3s, 1)
+        self.assertEqual(len(holes), len(expected))
+        for hole, expected_hole in zip(holes, expected):
+            np.testing.assert_allclose(hole.polygons[0], expected_hole.polygons[0], atol=1e-9)
+        return holes
+
+    def test_small_holes(self):
+        self.assertSameHoles(5, 50)
+        self.assertSameHoles(5, 11)
+
+    def test_holes_just_apart(self):
+        # 2 * radius is just under the period, so neighbouring holes nearly touch.
+        self.assertSameHoles(24.9, 50)
+        self.assertSameHoles(24, 48)
+
+    def test_touching_and_overlapping_holes(self):
+        self.assertSameHoles(10, 20)
+        self.assertSameHoles(30, 50)
+
+    def test_some_holes_removed(self):
+        x_min, x_max, y_min, y_max = self.extent
+        num_grid_points = len(range(x_min, x_max, 50)) * len(range(y_min, y_max, 50))
+        self.assertLess(len(self.assertSameHoles(24.9, 50)), num_grid_points)
+
+    def test_merge_holes(self):
+        x_min, x_max, y_min, y_max = self.extent
+        holes = rm._filter_holes(x_min, x_max, y_min, y_max, 50, 24.9, self.path3s, 1)
+        merged = rm._filter_holes(x_min, x_max, y_min, y_max, 50, 24.9, self.path3s, 1, merge_holes=True)
+        self.assertEqual(len(merged), 1)
+        np.testing.assert_array_equal(np.concatenate(merged[0].polygons),
+                                      np.concatenate([hole.polygons[0] for hole in holes]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,17 +1,21 @@
 from qcodes import VisaInstrument
 
+# Indexed by the status code at the front of a :fetch? response.
+_ERROR_STATEMENTS = (
+    None,  # No error
+    "Measurement error: ERR",
+    "Measurement error: NC or LoC",
+    "Measurement error: Other errors"
+)
+
 class ZM2376(VisaInstrument):
     """
     This class represents the ZM2376 instrument and inherits from the `VisaInstrument` class in qcodes.
     It provides functionality for controlling and performing measurements with the ZM2376 instrument.
     """
 
-    ERROR_STATEMENTS = {
-        0: None,  # No error
-        1: "Measurement error: ERR",
-        2: "Measurement error: NC or LoC",
-        3: "Measurement error: Other errors"
-    }
+    # Messages indexed by status code, the same tuple _get_output uses.
+    ERROR_STATEMENTS = _ERROR_STATEMENTS
 
     def __init__(self, name, address, **kwargs):
         """
@@ -175,16 +179,55 @@ class ZM2376(VisaInstrument):
             output (str): Measurement output as a string.
 
         Raises:
-            RuntimeError: If the measurement status indicates an error.
+            RuntimeError: If the measurement status indicates an error or is unknown.
         """
         output = self.ask(":fetch?")
 
-        if int(output.split(",")[0]) == 0:
-            msg = output
-        else:
-            raise RuntimeError(self.ERROR_STATEMENTS[int(output.split(",")[0])])
+        # Only the status code in front is needed here.
+        status = int(output.split(",", 1)[0])
+        if status != 0:
+            if 0 < status < len(_ERROR_STATEMENTS):
+                raise RuntimeError(_ERROR_STATEMENTS[status])
+            raise RuntimeError(f"Measurement error: unknown status {status}")
+
+        return output
+
+    def measure(self):
+        """
+        Reads the primary and secondary parameters from a single measurement.
+
+        Reading `primary` and `secondary` one after the other costs two fetches, and the two values may come from
+        different measurements. This does one fetch and returns both.
+
+        Returns:
+            tuple: (primary, secondary) measurement values as floats.
+
+        Raises:
+            RuntimeError: If the measurement status indicates an error.
+        """
+        parts = self._get_output().split(",", 3)
+        return float(parts[1]), float(parts[2])
+
+    def bulk_read(self, param_names):
+        """
+        Reads several parameters at once. The sweep module's Station uses this for the followed parameters of the
+        instrument.
+
+        `primary` and `secondary` come from a single fetch through `measure`, any other parameter is read on its own.
+
+        Parameters:
+            param_names (list): Names of the parameters to read.
+
+        Returns:
+            list: Values in the order of `param_names`.
+        """
+        values = {}
+        if "primary" in param_names or "secondary" in param_names:
+            values["primary"], values["secondary"] = self.measure()
+            self.primary.cache.set(values["primary"])
+            self.secondary.cache.set(values["secondary"])
 
-        return msg
+        return [values[name] if name in values else self.parameters[name].get() for name in param_names]
 
     def change_correction_limits(self, lower_limit, upper_limit):
         """
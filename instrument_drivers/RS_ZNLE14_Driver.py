@@ -1,5 +1,49 @@
+import re
+from functools import partial
+
 import numpy as np
 from qcodes import VisaInstrument, InstrumentChannel
+from qcodes.validators import Enum
+
+# Entries of a catalog reply such as '1,Trc1,2,Trc2': runs of characters between commas and quotes, without
+# surrounding whitespace. Numbers and names alternate.
+_CAT_RE = re.compile(r"[^,'\s](?:[^,']*[^,'\s])?")
+
+# Setpoint spacing for each sweep type with frequency setpoints.
+_SETPOINT_SPACINGS = {'LIN': np.linspace, 'LOG': np.geomspace}
+
+# SCPI form of a boolean state.
+_SET_STATES = {True: '1', False: '0'}
+
+# struct format of the trace values for each binary transfer precision, in bits.
+_BINARY_DATATYPES = {32: 'f', 64: 'd'}
+
+def _parse_catalog(resp: str) -> dict:
+    """Parse a catalog reply such as '1,Trc1,2,Trc2' into a dict of numbers to names."""
+    entries = _CAT_RE.findall(resp)
+    return dict(zip(entries[0::2], entries[1::2]))
+
+def _split_iq_traces(data, num_traces, sweep_points):
+    """
+    Split the flat I, Q, I, Q, ... data of several traces into one row per trace.
+
+    The number of points per trace comes from the cache of sweep_points. If that doesn't fit the size of data for
+    num_traces traces, the point count or the traces were changed behind the driver's back, from the front panel or
+    by a raw write, and the point count is read from the instrument instead.
+
+    Args:
+        data (np.ndarray): Interleaved I and Q values of all traces, one trace after the other.
+        num_traces (int): Number of traces the driver knows of in data.
+        sweep_points (Parameter): Number of points in each trace.
+
+    Returns:
+        tuple: I and Q as arrays of shape (number of traces, number of points).
+    """
+    num_swe_points = sweep_points.cache.get()
+    if data.size != 2 * num_traces * num_swe_points:
+        num_swe_points = sweep_points.get()
+    iq = data.reshape(-1, num_swe_points, 2)
+    return iq[..., 0], iq[..., 1]
 
 class ZNLE14(VisaInstrument):
     """
@@ -8,6 +52,8 @@ class ZNLE14(VisaInstrument):
     Parameters:
         name (str): Name of the instrument.
         address (str): VISA address of the instrument.
+        binary_transfer (bool): Transfer trace data as binary floats instead of ASCII.
+        transfer_precision (int): Bits per binary float, 32 or 64.
         **kwargs: Additional keyword arguments.
 
     Attributes:
@@ -15,31 +61,47 @@ class ZNLE14(VisaInstrument):
 
     Methods:
         reset(): Reset the instrument.
+        _configure_transfer_format(): Select the format trace data is sent in.
+        _ask_trace_data(cmd: str): Query trace data as a flat array.
+        _read_catalogs(): Read the channel, trace and window catalogs.
         _initialize_submodules(): Initialize submodules for channels, display, and parameters.
+        _sync_submodules(): Bring the channel, trace and window submodules in line with the instrument.
         get_all_traces(): Get all available traces.
         get_all_channels(): Get all available channels.
         create_new_channel(channel_num: int): Create a new channel.
         _get_all_trace_data_parser(raw_data: str): Parse raw trace data.
     """
 
-    def __init__(self, name: str, address: str, **kwargs):
+    def __init__(self, name: str, address: str, binary_transfer: bool = False, transfer_precision: int = 32, **kwargs):
         """
         Initialize ZNLE14 VNA Instrument.
 
         Args:
             name (str): Name of the instrument.
             address (str): VISA address of the instrument.
+            binary_transfer (bool): Transfer trace data as binary floats instead of ASCII. This is about a third
+                of the bytes of the ASCII format and needs no text parsing. Off by default as it is not yet
+                verified on the instrument.
+            transfer_precision (int): Bits per binary float, 32 or 64. 32 bits halves the bytes on the wire and is
+                enough for the resolution of the analyzer; 64 bits keeps the full internal precision.
             **kwargs: Additional keyword arguments.
         """
         
+        if transfer_precision not in _BINARY_DATATYPES:
+            raise ValueError(f'transfer_precision must be in {list(_BINARY_DATATYPES.keys())}.')
+        
         super().__init__(name, address, terminator='\r\n', **kwargs)
         self.connect_message()
         
+        self._binary_transfer = binary_transfer
+        self._transfer_precision = transfer_precision
+        self._configure_transfer_format()
+        
         self._initialize_submodules()
         
         self.add_parameter(
             "iq_trace_all_traces",
-            get_cmd='calc:data:all? sdat',
+            get_cmd=partial(self._ask_trace_data, 'calc:data:all? sdat'),
             get_parser=self._get_all_trace_data_parser,
             label='IQ Trace for all Traces on Instrument'
         )
@@ -47,64 +109,135 @@ class ZNLE14(VisaInstrument):
     def reset(self):
         """Reset the instrument."""
         self.write('*rst')
-        self.submodules.clear()
-        self._initialize_submodules()
+        self._configure_transfer_format()
+        self._sync_submodules()
+
+    def _configure_transfer_format(self):
+        """Select the format trace data is sent in. *rst sets it back to ASCII."""
+        if self._binary_transfer:
+            self.write(f'form real,{self._transfer_precision}')
+            self.write('form:bord swap')
+        else:
+            self.write('form asc')
+            
+    def _ask_trace_data(self, cmd: str):
+        """Query trace data and return it as a flat array of floats."""
+        if not self._binary_transfer:
+            # np.fromstring parses the bytes of the reply directly, which saves decoding the whole reply to str first.
+            # The query still goes out through write, so it is logged like any other.
+            self.write(cmd)
+            raw = self.visa_handle.read_raw()
+            self.visa_log.debug(f'Response: {len(raw)} bytes')
+            return np.fromstring(raw, sep=',')
+        
+        # The float data can contain the LF termination character, and the block may end with a bare LF
+        # rather than the '\r\n' set for replies. Read up to the END of the message instead, which takes the
+        # terminator along whatever it is; only the bytes the block header announces are parsed.
+        # pyvisa's read_termination_context doesn't restore the termination if the read fails, which would leave
+        # every later query waiting for END, so it is restored here instead.
+        self.visa_log.debug(f'Querying: {cmd}')
+        read_termination = self.visa_handle.read_termination
+        self.visa_handle.read_termination = None
+        try:
+            return self.visa_handle.query_binary_values(cmd, datatype=_BINARY_DATATYPES[self._transfer_precision],
+                                                        is_big_endian=False, container=np.ndarray,
+                                                        expect_termination=False)
+        finally:
+            self.visa_handle.read_termination = read_termination
+
+    def _read_catalogs(self):
+        """
+        Read the channel, trace and window catalogs.
+
+        Returns:
+            tuple: Channel catalog, trace catalog, dict of channel numbers to the trace catalog of that channel, and
+                window catalog.
+        """
+        channels = self.get_all_channels()
+        
+        # The remaining catalogs go out as one compound query. The replies come back in the same order, separated by
+        # semicolons: all traces, the traces of each channel, then the display windows.
+        queries = ['conf:trac:cat?']
+        queries += [f'conf:chan{channel_num}:trac:cat?' for channel_num in channels]
+        queries.append('disp:wind:cat?')
+        catalogs = [_parse_catalog(reply) for reply in self.ask(';:'.join(queries)).split(';')]
+        
+        return channels, catalogs[0], dict(zip(channels.keys(), catalogs[1:-1])), catalogs[-1]
 
     def _initialize_submodules(self):
         """Initialize submodules for channels, display, and parameters."""
-        self._channel_list = self.get_all_channels()
-        for channel_num in self._channel_list.keys():
+        self._channel_list, self._trace_list, channel_traces, windows_dict = self._read_catalogs()
+        
+        for channel_num, all_traces in channel_traces.items():
             channel = ZNLE14Channel(parent=self, channel_num=channel_num)
             self.add_submodule(channel._channel_name.lower(), channel)
-            all_traces = channel.get_all_traces_in_channel()
             for trace_num in all_traces.keys():
                 channel.create_new_trace(trace_num=trace_num, pre_existing=True)
                 
-        display = ZNLE14Display(parent=self)
+        display = ZNLE14Display(parent=self, windows_dict=windows_dict)
         self.add_submodule('display', display)
         
         params = ZNLEParams(parent=self)
         self.add_submodule('params', params)
         
+    def _sync_submodules(self):
+        """
+        Bring the channel, trace and window submodules in line with the instrument.
+
+        Submodules that are still on the instrument are kept, only the ones that appeared or disappeared are added or
+        removed. Kept traces get their S-parameter reset and the cached parameter values are invalidated, as they may
+        have changed as well.
+        """
+        self._channel_list, self._trace_list, channel_traces, windows_dict = self._read_catalogs()
+        
+        for name, channel in list(self.submodules.items()):
+            if isinstance(channel, ZNLE14Channel) and str(channel._channel_num) not in channel_traces:
+                self.submodules.pop(name)
+                
+        for channel_num, all_traces in channel_traces.items():
+            channel = self.submodules.get(f'ch{channel_num}')
+            if channel is None:
+                channel = ZNLE14Channel(parent=self, channel_num=channel_num)
+                self.add_submodule(channel._channel_name.lower(), channel)
+                
+            for trace_num in list(channel._channel_traces.keys()):
+                if trace_num not in all_traces:
+                    channel.submodules.pop(f'trc{trace_num}')
+                    channel._channel_traces.pop(trace_num)
+                else:
+                    # A kept trace may have been redefined, so assume S21 as for a trace found at start-up.
+                    channel.submodules[f'trc{trace_num}']._s_param = 'S21'
+            for trace_num in all_traces.keys():
+                if trace_num not in channel._channel_traces:
+                    channel.create_new_trace(trace_num=trace_num, pre_existing=True)
+                    
+        self.display._sync_windows(windows_dict)
+        
+        for parameter in self.params.parameters.values():
+            parameter.cache.invalidate()
+        
     def get_all_traces(self):
         """Get all available traces."""
-        traces = self.ask('conf:trac:cat?').strip()
-        trace_nums = traces.split(',')[0::2]
-        trace_names = traces.split(',')[1::2]
-        traces = {num.strip("'") : name.strip("'") for num, name in zip(trace_nums, trace_names)}
-        return traces
+        return _parse_catalog(self.ask('conf:trac:cat?'))
     
     def get_all_channels(self):
         """Get all available channels."""
-        channels = self.ask('conf:chan:cat?').strip()
-        channel_nums = channels.split(',')[0::2]
-        channel_names = channels.split(',')[1::2]
-        channels = {num.strip("'") : name.strip("'") for num, name in zip(channel_nums, channel_names)}
-        return channels
+        return _parse_catalog(self.ask('conf:chan:cat?'))
 
     def create_new_channel(self, channel_num: int):
         """Create a new channel."""
-        if str(channel_num) in list(self.get_all_channels().keys()):
+        if str(channel_num) in self._channel_list:
             raise AttributeError("Channel with this number already exists.")
         else:
             channel = ZNLE14Channel(parent=self, channel_num=channel_num)
             self.add_submodule(channel._channel_name.lower(), channel)
         
+        # Read the catalog back rather than assuming the channel was created as asked.
         self._channel_list = self.get_all_channels()
         
-    def _get_all_trace_data_parser(self, raw_data: str):
+    def _get_all_trace_data_parser(self, raw_data: np.ndarray):
         """Parse raw trace data."""
-        data = raw_data.strip().split(',')
-        data = [float(point) for point in data]
-        i_all = data[0::2]
-        q_all = data[1::2]
-        
-        num_swe_points = self.params.sweep_points.get()
-        
-        i_s = [i_all[i:i + num_swe_points] for i in range(0, len(i_all), num_swe_points)]
-        q_s = [q_all[i:i + num_swe_points] for i in range(0, len(q_all), num_swe_points)]
-        
-        return i_s, q_s
+        return _split_iq_traces(raw_data, len(self._trace_list), self.params.sweep_points)
     
 class ZNLE14Channel(InstrumentChannel):
     """
@@ -135,12 +268,13 @@ class ZNLE14Channel(InstrumentChannel):
         
         self._channel_num = channel_num
         self._channel_name = f"Ch{self._channel_num}"
+        self._channel_traces = {}
         
         super().__init__(parent, self._channel_name)
         
         self.add_parameter(
             "iq_trace_all_channeltraces",
-            get_cmd='calc1:data:chan:dall? sdat',
+            get_cmd=partial(parent._ask_trace_data, 'calc1:data:chan:dall? sdat'),
             get_parser = self._get_all_trace_data_parser,
             label='IQ Trace for all Traces in Channels'
         )
@@ -151,37 +285,24 @@ class ZNLE14Channel(InstrumentChannel):
             trace = ZNLE14ChannelTrace(self, trace_num, 'S21')
             self.add_submodule(trace._trace_name.lower(), trace)
         else:
-            if str(trace_num) in list(self._parent.get_all_traces().keys()):
+            if str(trace_num) in self._parent._trace_list:
                 raise AttributeError("Trace with this number already exists.")
             else:
                 trace_name = f"Trc{trace_num}"
                 self._parent.write(f'calc{self._channel_num}:par:sdef "{trace_name}", "{s_param}"')
                 trace = ZNLE14ChannelTrace(self, trace_num, s_param)
                 self.add_submodule(trace._trace_name.lower(), trace)
+                self._parent._trace_list[str(trace_num)] = trace._trace_name
                 
-        self._channel_traces = self.get_all_traces_in_channel()
+        self._channel_traces[str(trace_num)] = trace._trace_name
                         
     def get_all_traces_in_channel(self):
         """Get all traces in the channel."""
-        traces = self._parent.ask(f'conf:chan{self._channel_num}:trac:cat?').strip()
-        trace_nums = traces.split(',')[0::2]
-        trace_names = traces.split(',')[1::2]
-        traces = {num.strip("'") : name.strip("'") for num, name in zip(trace_nums, trace_names)}
-        return traces
+        return _parse_catalog(self._parent.ask(f'conf:chan{self._channel_num}:trac:cat?'))
     
-    def _get_all_trace_data_parser(self, raw_data: str):
+    def _get_all_trace_data_parser(self, raw_data: np.ndarray):
         """Parse raw trace data."""
-        data = raw_data.strip().split(',')
-        data = [float(point) for point in data]
-        i_all = data[0::2]
-        q_all = data[1::2]
-        
-        num_swe_points = self._parent.params.sweep_points.get()
-        
-        i_s = [i_all[i:i + num_swe_points] for i in range(0, len(i_all), num_swe_points)]
-        q_s = [q_all[i:i + num_swe_points] for i in range(0, len(q_all), num_swe_points)]
-        
-        return i_s, q_s
+        return _split_iq_traces(raw_data, len(self._channel_traces), self._parent.params.sweep_points)
     
 class ZNLE14ChannelTrace(InstrumentChannel):
     """
@@ -202,6 +323,7 @@ class ZNLE14ChannelTrace(InstrumentChannel):
         delete_trace(): Delete the trace.
         _iq_trace_parser(raw_data: str): Parse IQ trace data.
         _iq_point_parser(raw_data: str): Parse IQ point data.
+        _iq_complex_parser(raw_data: np.ndarray): Parse IQ trace data into a complex array.
     """
     
     def __init__(self, parent: ZNLE14Channel, trace_num: int, s_param: str = None) -> None:
@@ -214,53 +336,67 @@ class ZNLE14ChannelTrace(InstrumentChannel):
             s_param (Optional[str]): S-parameter name.
         """
 
+        self._trace_num = str(trace_num)
         self._trace_name = f"Trc{trace_num}"
         self._s_param = s_param
 
         super().__init__(parent, self._trace_name.lower())
         
         self._channel_name = self._parent._channel_name
+        self._root = self._parent._parent
+        self._cmd_select = f'calc{self._parent._channel_num}:par:sel {self._trace_name}'
+        self._cmd_delete = f":calc:par:del '{self._trace_name}'"
         
         self.add_parameter(
             "iq_trace",
-            get_cmd=f"calc:data:trac? '{self._trace_name}', sdat",
+            get_cmd=partial(self.root_instrument._ask_trace_data, f"calc:data:trac? '{self._trace_name}', sdat"),
             get_parser = self._iq_trace_parser,
             label='Real and Imaginary Trace Data'
         )
         
         self.add_parameter(
             "iq_points",
-            get_cmd=f"calc:data:trac? '{self._trace_name}', sdat",
+            get_cmd=partial(self.root_instrument._ask_trace_data, f"calc:data:trac? '{self._trace_name}', sdat"),
             get_parser = self._iq_point_parser,
             label='Real and Imaginary Point Data'
         )
         
+        self.add_parameter(
+            "iq_trace_complex",
+            get_cmd=partial(self.root_instrument._ask_trace_data, f"calc:data:trac? '{self._trace_name}', sdat"),
+            get_parser = self._iq_complex_parser,
+            label='Complex Trace Data'
+        )
+        
     def set_as_active(self):
         """Set the trace as active."""
-        self._parent._parent.write(f'calc{self._parent._channel_num}:par:sel {self._trace_name}')
+        self._root.write(self._cmd_select)
         
     def delete_trace(self):
         """Delete the trace."""
-        self._parent._parent.write(f":calc:par:del '{self._trace_name}'")
+        self._root.write(self._cmd_delete)
         self._parent.submodules.pop(self._label)
+        self._parent._channel_traces.pop(self._trace_num, None)
+        self._root._trace_list.pop(self._trace_num, None)
 
-    def _iq_trace_parser(self, raw_data: str):
+    def _iq_trace_parser(self, raw_data: np.ndarray):
         """Parse IQ trace data."""
-        data = raw_data.strip().split(',')
-        data = [float(point) for point in data]
-        i = data[0::2]
-        q = data[1::2]
+        i = raw_data[0::2]
+        q = raw_data[1::2]
         
         return i, q
     
-    def _iq_point_parser(self, raw_data: str):
+    def _iq_point_parser(self, raw_data: np.ndarray):
         """Parse IQ point data."""
-        data = raw_data.strip().split(',')
-        data = [float(point) for point in data]
-        i = data[0::2]
-        q = data[1::2]
+        i, q = raw_data.reshape(-1, 2).mean(axis=0)
         
-        return np.mean(i), np.mean(q)
+        return i, q
+    
+    def _iq_complex_parser(self, raw_data: np.ndarray):
+        """Parse IQ trace data into one complex array, I + jQ."""
+        # Interleaved I, Q pairs have the memory layout of complex numbers, so this is a view rather than a copy:
+        # complex64 for 32 bit binary transfers, complex128 for 64 bit and ASCII.
+        return raw_data.view(np.result_type(raw_data.dtype, np.complex64))
 
 class ZNLE14Display(InstrumentChannel):
     """
@@ -270,41 +406,49 @@ class ZNLE14Display(InstrumentChannel):
         parent (ZNLE14Channel): Parent channel.
 
     Methods:
+        _sync_windows(windows_dict: dict): Add and remove window submodules to match a window catalog.
         get_all_windows(): Get all available windows.
         create_a_new_disp_window(window_num: Optional[int] = None): Create a new display window.
         add_trace_to_new_window(trace: ZNLE14ChannelTrace, window_num: Optional[int] = None): Add a trace to a new window.
         autoscale_on_all_windows(): Autoscale on all windows.
     """
     
-    def __init__(self, parent: ZNLE14Channel) -> None:
+    def __init__(self, parent: ZNLE14Channel, windows_dict: dict = None) -> None:
         """
         Initialize ZNLE14 Display.
 
         Args:
             parent (ZNLE14Channel): Parent channel.
+            windows_dict (Optional[dict]): Window catalog if already known, queried from the instrument otherwise.
         """
 
         super().__init__(parent, 'display')
         
-        self._windows_dict = self.get_all_windows()
+        self._windows_dict = windows_dict if windows_dict is not None else self.get_all_windows()
+        self._window_nums = {int(num) for num in self._windows_dict}
         for window_num in list(self._windows_dict.keys()):
             window = ZNLE14DisplayWindow(parent=self, window_num=window_num)
             self.add_submodule(window._window_name, window)
         
+    def _sync_windows(self, windows_dict: dict):
+        """Add and remove window submodules to match the window catalog windows_dict."""
+        for window_num in self._windows_dict.keys() - windows_dict.keys():
+            self.submodules.pop(f'win{window_num}', None)
+        for window_num in windows_dict.keys() - self._windows_dict.keys():
+            window = ZNLE14DisplayWindow(parent=self, window_num=window_num)
+            self.add_submodule(window._window_name, window)
+            
+        self._windows_dict = windows_dict
+        self._window_nums = {int(num) for num in self._windows_dict}
+        
     def get_all_windows(self):
         """Get all available windows."""
-        windows = self._parent.ask('disp:wind:cat?').strip()
-        window_nums = windows.split(',')[0::2]
-        window_names = windows.split(',')[1::2]
-        windows = {num.strip("'") : name.strip("'") for num, name in zip(window_nums, window_names)}
-        return windows
+        return _parse_catalog(self._parent.ask('disp:wind:cat?'))
     
     def create_a_new_disp_window(self, window_num: int = None):
-        """Create a new display window."""
+        """Create a new display window and return it."""
         if window_num is None:
-            window_nums = list(self._windows_dict.keys())
-            window_nums = [int(x) for x in window_nums]
-            window_num = np.max(window_nums) + 1
+            window_num = max(self._window_nums, default=0) + 1
             
         self._parent.write(f'disp:wind{window_num}:stat on')
         
@@ -312,23 +456,19 @@ class ZNLE14Display(InstrumentChannel):
         self.add_submodule(window._window_name, window)
         
         self._windows_dict = self.get_all_windows()
+        self._window_nums = {int(num) for num in self._windows_dict}
+
+        return window
         
     def add_trace_to_new_window(self, trace: ZNLE14ChannelTrace, window_num: int = None):
         """Add a trace to a new window."""
-        self.create_a_new_disp_window(window_num=window_num)
-        self._parent.write(f'disp:wind{window_num}:trac:efe "{trace._trace_name}"')
-        
-        window = ZNLE14DisplayWindow(parent=self, window_num=window_num)
-        self.add_submodule(window._window_name, window)
-        
-        self._windows_dict = self.get_all_windows()
+        window = self.create_a_new_disp_window(window_num=window_num)
+        window.add_trace(trace)
         
     def autoscale_on_all_windows(self):
         """Autoscale on all windows."""
-        window_nums = self._windows_dict.keys()
-        window_nums = [int(num) for num in window_nums]
-        for window_num in window_nums:
-            self.write(f'disp:wind{window_num}:trac:y:auto once')
+        if self._window_nums:
+            self.write(';:'.join(f'disp:wind{window_num}:trac:y:auto once' for window_num in sorted(self._window_nums)))
 
 class ZNLE14DisplayWindow(InstrumentChannel):
     """
@@ -354,16 +494,18 @@ class ZNLE14DisplayWindow(InstrumentChannel):
         
         self._window_num = window_num
         self._window_name = f'win{self._window_num}'
+        self._cmd_add_trace = f'disp:wind{self._window_num}:trac:efe "{{}}"'
+        self._cmd_autoscale = f'disp:wind{self._window_num}:trac:y:auto once'
 
         super().__init__(parent, self._window_name)
         
     def add_trace(self, trace: ZNLE14ChannelTrace):
         """Add a trace to the window."""
-        self._parent.write(f'disp:wind{self._window_num}:trac:efe "{trace._trace_name}"')
+        self._parent.write(self._cmd_add_trace.format(trace._trace_name))
         
     def autoscale_on(self):
         """Autoscale on the window."""
-        self.write(f'disp:wind{self._window_num}:trac:y:auto once')
+        self.write(self._cmd_autoscale)
 
 class ZNLEParams(InstrumentChannel):
     """
@@ -374,6 +516,9 @@ class ZNLEParams(InstrumentChannel):
 
     Methods:
         get_freq_setpoints(): Get frequency setpoints.
+        _get_transfer_precision(): Get the bits per value of binary trace transfers.
+        _set_transfer_precision(precision: int): Set the bits per value of binary trace transfers.
+        _normalize_sweep_type(sweep_type: str): Normalize the case of a sweep type.
         _sweep_type_parser(sweep_type: str): Parse sweep type.
         _get_state_parser(state: str): Parse state.
         _set_state_parser(state): Set state.
@@ -390,6 +535,7 @@ class ZNLEParams(InstrumentChannel):
         super().__init__(parent, 'params')
         
         self._sweep_types = {'LIN' : 'Linear', 'LOG' : 'Logarithmic', 'CW' : 'Time Sweep'}
+        self._setpoint_cache = (None, None)
         
         self.add_parameter(
             "freq_center",
@@ -439,7 +585,7 @@ class ZNLEParams(InstrumentChannel):
         self.add_parameter(
             "sweep_type",
             get_cmd='swe:type?',
-            get_parser = str,
+            get_parser = self._normalize_sweep_type,
             set_cmd='swe:type {}',
             set_parser = self._sweep_type_parser,
             label='Type of the Sweep'
@@ -481,22 +627,56 @@ class ZNLEParams(InstrumentChannel):
             label='Source Power'
         )
         
+        self.add_parameter(
+            "transfer_precision",
+            get_cmd=self._get_transfer_precision,
+            set_cmd=self._set_transfer_precision,
+            vals=Enum(*_BINARY_DATATYPES),
+            label='Bits per Value of Binary Trace Transfers'
+        )
+        
     def get_freq_setpoints(self):
         """Get frequency setpoints."""
-        start = self.freq_start.get()
-        stop = self.freq_stop.get()
-        num_points = self.sweep_points.get()
-        sweep_type = self.sweep_type.get().strip()
-        
-        if sweep_type.lower() == 'lin':
-            setpoints = np.linspace(start, stop, num_points)
-        elif sweep_type.lower() == 'log':
-            setpoints = np.logspace(np.log10(start), np.log10(stop), num_points)
+        # One round trip for all four settings; the replies come back separated by ';'.
+        start, stop, num_points, sweep_type = self.ask('freq:star?;:freq:stop?;:swe:poin?;:swe:type?').split(';')
+        start, stop, num_points, sweep_type = float(start), float(stop), int(num_points), self._normalize_sweep_type(sweep_type)
+        
+        self.freq_start.cache.set(start)
+        self.freq_stop.cache.set(stop)
+        self.sweep_points.cache.set(num_points)
+        self.sweep_type.cache.set(sweep_type)
+        
+        key = (start, stop, num_points, sweep_type)
+        if key == self._setpoint_cache[0]:
+            return self._setpoint_cache[1]
+        
+        if sweep_type not in _SETPOINT_SPACINGS:
+            raise AttributeError(f'Frequency setpoints need a sweep type in {list(_SETPOINT_SPACINGS.keys())}, not {sweep_type}.')
+        setpoints = _SETPOINT_SPACINGS[sweep_type](start, stop, num_points)
+        
+        # The same array is handed out until the sweep settings change, so it must not be modified in place.
+        setpoints.setflags(write=False)
+        self._setpoint_cache = (key, setpoints)
             
         return setpoints
         
+    def _get_transfer_precision(self):
+        """Get the bits per value of binary trace transfers."""
+        return self._parent._transfer_precision
+        
+    def _set_transfer_precision(self, precision):
+        """Set the bits per value of binary trace transfers and send the new format to the instrument."""
+        self._parent._transfer_precision = precision
+        self._parent._configure_transfer_format()
+        
+    @staticmethod
+    def _normalize_sweep_type(sweep_type):
+        """Bring a sweep type to the upper case form used as key in _sweep_types."""
+        return str(sweep_type).strip().upper()
+        
     def _sweep_type_parser(self, sweep_type):
         """Parse sweep type."""
+        sweep_type = self._normalize_sweep_type(sweep_type)
         if sweep_type not in self._sweep_types:
             raise AttributeError(f'Sweep type must be in {list(self._sweep_types.keys())}. Check instrument._sweep_types.')
         else:
@@ -504,14 +684,8 @@ class ZNLEParams(InstrumentChannel):
             
     def _get_state_parser(self, state):
         """Parse state."""
-        if state == '0':
-            return True
-        else:
-            return False
+        return state.strip() == '1'
         
     def _set_state_parser(self, state):
         """Set state."""
-        if state:
-            return '1'
-        else:
-            return '0'
\ No newline at end of file
+        return _SET_STATES[bool(state)]
\ No newline at end of file
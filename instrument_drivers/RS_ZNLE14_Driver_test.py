@@ -0,0 +1,59 @@
+import logging
+import types
+import unittest
+
+import numpy as np
+
+from . import RS_ZNLE14_Driver as znle
+
+
+class _DummyVisaHandle:
+    def __init__(self, data=None, error=None, reply=b''):
+        self.read_termination = '\r\n'
+        self._data = data
+        self._error = error
+        self._reply = reply
+        self.read_terminations = []
+
+    def read_raw(self):
+        return self._reply
+
+    def query_binary_values(self, cmd, **kwargs):
+        self.read_terminations.append(self.read_termination)
+        if self._error is not None:
+            raise self._error
+        return np.array(self._data, dtype=kwargs['datatype'])
+
+
+def _dummy_instrument(visa_handle, binary_transfer=True):
+    instrument = types.SimpleNamespace(visa_handle=visa_handle, visa_log=logging.getLogger(__name__),
+                                       _binary_transfer=binary_transfer, _transfer_precision=32, written=[])
+    instrument.write = instrument.written.append
+    return instrument
+
+
+class TestAskTraceData(unittest.TestCase):
+    def test_ascii(self):
+        handle = _DummyVisaHandle(reply=b'1.5,-2E+03,3\r\n')
+        instrument = _dummy_instrument(handle, binary_transfer=False)
+        data = znle.ZNLE14._ask_trace_data(instrument, 'calc:data:all? sdat')
+        np.testing.assert_array_equal(data, [1.5, -2000, 3])
+        self.assertEqual(instrument.written, ['calc:data:all? sdat'])
+
+    def test_binary(self):
+        handle = _DummyVisaHandle(data=[1.0, 2.0])
+        data = znle.ZNLE14._ask_trace_data(_dummy_instrument(handle), 'calc:data:all? sdat')
+        np.testing.assert_array_equal(data, [1.0, 2.0])
+        # The block is read up to END, and the termination is back afterwards.
+        self.assertEqual(handle.read_terminations, [None])
+        self.assertEqual(handle.read_termination, '\r\n')
+
+    def test_binary_error_restores_termination(self):
+        handle = _DummyVisaHandle(error=TimeoutError('timeout'))
+        with self.assertRaises(TimeoutError):
+            znle.ZNLE14._ask_trace_data(_dummy_instrument(handle), 'calc:data:all? sdat')
+        self.assertEqual(handle.read_termination, '\r\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
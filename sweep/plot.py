@@ -17,6 +17,7 @@ class _Action(enum.Enum):
     STOP  = 'stop'
     SEND_IMAGE = 'send_image'
     ADD_POINT = 'add_point'
+    ADD_POINTS = 'add_points'
     START_NEW_LINE = 'add_point_to_new_line'
 
 
@@ -57,82 +58,59 @@ class _PlotProc:
         plt.close(self._fig)
     
     def add_points(self, points):
-        for point in points:
-            for x, y, line in self._lines:
-                if x not in point or y not in point:
-                    continue
-                line.set_xdata(np.append(line.get_xdata(), point[x]))
-                line.set_ydata(np.append(line.get_ydata(), point[y]))
-            for x, y, z, xd, yd, zd, ax in self._meshes:
-                if x not in point or y not in point or z not in point:
-                    continue
-                xd.append(point[x])
-                yd.append(point[y])
-                zd.append(point[z])
-                xmin, xmax, lx = np.min(xd), np.max(xd), len(np.unique(xd))
-                ymin, ymax, ly = np.min(yd), np.max(yd), len(np.unique(yd))
-                xi = np.linspace(xmin, xmax, lx)
-                yi = np.linspace(ymin, ymax, ly)
-                X, Y = np.meshgrid(xi, yi)
-                ax.clear()
-                if lx > 1 and ly > 1:
-                    zi = griddata((xd, yd), zd, (X, Y))
-                    ax.pcolormesh(X, Y, zi, shading='nearest')
-                    ax.set_xlabel(x)
-                    ax.set_ylabel(y)
-                elif lx == 1 and ly > 1:
-                    ax.plot(yd, zd)
-                    ax.set_xlabel(y)
-                    ax.set_ylabel(z)
-                elif ly == 1 and lx > 1:
-                    ax.plot(xd, zd)
-                    ax.set_xlabel(x)
-                    ax.set_ylabel(z)
-                if lx > 1 and ly > 1:
-                    ax.set_xlim(np.min(xd), np.max(xd))
-                    ax.set_ylim(np.min(yd), np.max(yd))
-        for ax in self._axs:
-            ax.relim()
-            ax.autoscale_view()
-        
-        self._fig.tight_layout()
-        self._fig.canvas.draw()
+        self._add_points(points, new_line=False)
 
     def add_points_new_line(self, points):
-        for point in points:
-            for x, y, line in self._lines:
+        self._add_points(points, new_line=True)
+
+    def _add_points(self, points, new_line):
+        # Every line and mesh is extended once for the whole batch of points,
+        # and the figure is drawn once at the end.
+        for x, y, line in self._lines:
+            xs, ys = [], []
+            for point in points:
                 if x not in point or y not in point:
                     continue
-                line.set_xdata(np.append(line.get_xdata(), np.append(None, point[x])))
-                line.set_ydata(np.append(line.get_ydata(), np.append(None, point[y])))
-            for x, y, z, xd, yd, zd, ax in self._meshes:
+                if new_line:
+                    xs.append(None)
+                    ys.append(None)
+                xs.append(point[x])
+                ys.append(point[y])
+            if xs:
+                line.set_xdata(np.append(line.get_xdata(), xs))
+                line.set_ydata(np.append(line.get_ydata(), ys))
+        for x, y, z, xd, yd, zd, ax in self._meshes:
+            n = len(zd)
+            for point in points:
                 if x not in point or y not in point or z not in point:
                     continue
                 xd.append(point[x])
                 yd.append(point[y])
                 zd.append(point[z])
-                xmin, xmax, lx = np.min(xd), np.max(xd), len(np.unique(xd))
-                ymin, ymax, ly = np.min(yd), np.max(yd), len(np.unique(yd))
-                xi = np.linspace(xmin, xmax, lx)
-                yi = np.linspace(ymin, ymax, ly)
-                X, Y = np.meshgrid(xi, yi)
-                ax.clear()
-                if lx > 1 and ly > 1:
-                    zi = griddata((xd, yd), zd, (X, Y))
-                    ax.pcolormesh(X, Y, zi, shading='nearest')
-                    ax.set_xlabel(x)
-                    ax.set_ylabel(y)
-                elif lx == 1 and ly > 1:
-                    ax.plot(yd, zd)
-                    ax.set_xlabel(y)
-                    ax.set_ylabel(z)
-                elif ly == 1 and lx > 1:
-                    ax.plot(xd, zd)
-                    ax.set_xlabel(x)
-                    ax.set_ylabel(z)
-                if lx > 1 and ly > 1:
-                    ax.set_xlim(np.min(xd), np.max(xd))
-                    ax.set_ylim(np.min(yd), np.max(yd))
+            if len(zd) == n:
+                continue
+            xmin, xmax, lx = np.min(xd), np.max(xd), len(np.unique(xd))
+            ymin, ymax, ly = np.min(yd), np.max(yd), len(np.unique(yd))
+            xi = np.linspace(xmin, xmax, lx)
+            yi = np.linspace(ymin, ymax, ly)
+            X, Y = np.meshgrid(xi, yi)
+            ax.clear()
+            if lx > 1 and ly > 1:
+                zi = griddata((xd, yd), zd, (X, Y))
+                ax.pcolormesh(X, Y, zi, shading='nearest')
+                ax.set_xlabel(x)
+                ax.set_ylabel(y)
+            elif lx == 1 and ly > 1:
+                ax.plot(yd, zd)
+                ax.set_xlabel(y)
+                ax.set_ylabel(z)
+            elif ly == 1 and lx > 1:
+                ax.plot(xd, zd)
+                ax.set_xlabel(x)
+                ax.set_ylabel(z)
+            if lx > 1 and ly > 1:
+                ax.set_xlim(np.min(xd), np.max(xd))
+                ax.set_ylim(np.min(yd), np.max(yd))
         for ax in self._axs:
             ax.relim()
             ax.autoscale_view()
@@ -146,6 +124,13 @@ class _PlotProc:
         return b
 
 
+def _draw_points(p, points, new_line):
+    if new_line:
+        p.add_points_new_line(points)
+    else:
+        p.add_points(points)
+
+
 def _plot_loop(conn):
     signal.signal(signal.SIGINT, signal.SIG_IGN)
     p = _PlotProc()
@@ -154,8 +139,10 @@ def _plot_loop(conn):
         messages = []
         while conn.poll():
             messages.append(conn.recv())
-        data_same_line = []
-        data_new_line = []
+        # Consecutive points of the same kind are drawn as one batch, in the
+        # order they were sent.
+        points = []
+        new_line = False
         send = False
         for m in messages:
             if m['action'] == _Action.START:
@@ -164,14 +151,18 @@ def _plot_loop(conn):
                 quit = True
             elif m['action'] == _Action.SEND_IMAGE:
                 send = True
-            elif m['action'] == _Action.ADD_POINT:
-                data_same_line.append(m['data'])
-            elif m['action'] == _Action.START_NEW_LINE:
-                data_new_line.append(m['data'])
-        if len(data_same_line) > 0:
-            p.add_points(data_same_line)
-        if len(data_new_line) > 0:
-            p.add_points_new_line(data_new_line)
+            elif m['action'] in (_Action.ADD_POINT, _Action.ADD_POINTS, _Action.START_NEW_LINE):
+                is_new_line = m['action'] == _Action.START_NEW_LINE
+                if points and is_new_line != new_line:
+                    _draw_points(p, points, new_line)
+                    points = []
+                new_line = is_new_line
+                if m['action'] == _Action.ADD_POINTS:
+                    points.extend(m['data'])
+                else:
+                    points.append(m['data'])
+        if len(points) > 0:
+            _draw_points(p, points, new_line)
         if send:
             conn.send(p.image())
         if quit:
@@ -244,6 +235,13 @@ class Plotter:
             'data': self._format_data_map(data),
         })
 
+    def add_points(self, rows):
+        if len(self._plots) == 0 or len(rows) == 0: return
+        self._parent_pipe.send({
+            'action': _Action.ADD_POINTS,
+            'data': [self._format_data_map(data) for data in rows],
+        })
+
     def add_point_to_new_line(self, data):
         if len(self._plots) == 0: return
         self._parent_pipe.send({
@@ -6,7 +6,6 @@ import socket
 import inspect
 import signal
 import time
-import datetime
 from typing import Callable, Dict, List, Union
 import numpy as np
 
@@ -21,6 +20,35 @@ def set_basedir(path):
     global BASEDIR
     BASEDIR = path
 
+_HOSTNAME = socket.gethostname()
+
+# Format of the human readable start and end times in the metadata.
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Longest uninterrupted sleep in Station._sleep, in seconds.
+_SLEEP_SLICE = 0.1
+
+# A _RowBatch writes its rows once it holds this many, or once this many
+# seconds have passed since its last write.
+_BATCH_ROWS = 256
+_BATCH_SECONDS = 1.0
+
+# Marks the values in Station._measure_into that no bulk_read has filled in.
+_NOT_READ = object()
+
+def magnitude_db(i, q, out=None):
+    '''Return the power of I/Q data in dB, 10*log10(I^2 + Q^2).
+
+    This is the noise column of a followed trace. If out is given, the result
+    is written into it.
+    '''
+    # 20*log10(hypot(I, Q)) is the same value, but hypot doesn't over- or
+    # underflow for very large or small I and Q like squaring them does.
+    magnitude = np.hypot(i, q, out=out)
+    out = np.log10(magnitude, out=out)
+    out *= 20
+    return out
+
 def _sec_to_str(d):
     h, m, s = int(d/3600), int(d/60) % 60, int(d) % 60
     return f'{h}h {m}m {s}s'
@@ -34,20 +62,68 @@ class SweepResult:
     datapath: str
 
 
+class _RowBatch:
+    '''Collects the rows of a sweep and hands them to a db.Writer in batches.
+
+    Rows are written when _BATCH_ROWS have been collected, when
+    _BATCH_SECONDS have passed since the last write, and on leaving the
+    with block, also on an exception.
+    '''
+    def __init__(self, w):
+        self._w = w
+        self._rows = []
+        self._last_write = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+    def add_point(self, point: List):
+        self._rows.append(point)
+        if len(self._rows) >= _BATCH_ROWS or time.monotonic() - self._last_write >= _BATCH_SECONDS:
+            self.flush()
+
+    def flush(self):
+        if self._rows:
+            self._w.add_points(self._rows)
+            self._rows = []
+        self._last_write = time.monotonic()
+
+
+# The Station whose sweep is running, and the SIGINT handler that was in
+# place before _sigint_handler was installed.
+_running_station = None
+_previous_sigint_handler = None
+
+def _sigint_handler(signum, frame):
+    if _running_station is not None:
+        _running_station.interrupt_requested = True
+    elif callable(_previous_sigint_handler):
+        _previous_sigint_handler(signum, frame)
+    elif _previous_sigint_handler != signal.SIG_IGN:
+        raise KeyboardInterrupt
+
 def _interruptible(func):
     # We don't want to allow interrupts while communicating with
-    # instruments. This checks for interrupts after measuring.
-    # TODO: Allow interrupting the time.sleep() somehow, and potentially
-    #       also the param(setpoint) if possible.
+    # instruments. This checks for interrupts after measuring, and
+    # Station._sleep cuts delays short.
+    # TODO: Allow interrupting the param(setpoint) if possible.
+    # The handler is installed once and stays in place. Outside of a sweep it
+    # passes Ctrl-C on to the previous handler.
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        global _running_station, _previous_sigint_handler
+        if signal.getsignal(signal.SIGINT) is not _sigint_handler:
+            _previous_sigint_handler = signal.signal(signal.SIGINT, _sigint_handler)
         args[0].interrupt_requested = False
-        def handler(signum, frame):
-            args[0].interrupt_requested = True
-        old_handler = signal.signal(signal.SIGINT, handler)
-        result = func(*args, **kwargs)
-        signal.signal(signal.SIGINT, old_handler)
-        return result
+        outer_station = _running_station
+        _running_station = args[0]
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _running_station = outer_station
     return wrapper
 
 
@@ -56,6 +132,11 @@ class Station:
 
     You can do 0D (measure), 1D (sweep), and 2D (megasweep) sweeps, and you can
     measure over time with watch.
+
+    An instrument can read several of its followed parameters at once by
+    providing bulk_read(param_names), which takes the parameter names and
+    returns their values in the same order. The followed parameters of such
+    an instrument are read with one bulk_read call per point.
     '''
 
     def __init__(self, basedir: str=None, verbose: bool=True):
@@ -70,33 +151,174 @@ class Station:
 
         self._verbose: bool = verbose
         self._params: List = []
+        self._instrument_names: List[str] = []
         self._traces: List = []
         self._trace_cols: List = []
+        self._trace_infos: Dict = {}
+        self._col_names_cache: List = None
+        self._bulk_reads_cache: List = None
         self._traces_points: List = []
         self._plotter = plot.Plotter()
         self._notes = ""
         self._calling_file_path = os.path.join(os.getcwd(), os.path.splitext(os.path.basename(os.getcwd()))[0] + ".ipynb")
 
+    def _sleep(self, delay: float):
+        '''Sleep for delay seconds, or until an interrupt is requested.'''
+        # A signal handler doesn't end time.sleep early, so sleep in short
+        # slices and check for interrupts in between.
+        deadline = time.monotonic() + delay
+        remaining = delay
+        while remaining > 0 and not self.interrupt_requested:
+            time.sleep(min(remaining, _SLEEP_SLICE))
+            remaining = deadline - time.monotonic()
+
     def _measure(self) -> List[float]:
-        return [p() / gain for p, gain in self._params]
+        return self._measure_into([])
+
+    def _bulk_reads(self) -> List:
+        '''Group the followed parameters of instruments that can read several
+        parameters at once through a bulk_read(param_names) method.
+
+        Returns a list of (instrument, param names, column indices).
+        '''
+        if self._bulk_reads_cache is None:
+            groups = {}
+            for k, (p, _) in enumerate(self._params):
+                instrument = getattr(p, 'instrument', None)
+                if hasattr(instrument, 'bulk_read'):
+                    names, indices = groups.setdefault(id(instrument), (instrument, [], []))[1:]
+                    names.append(p.name)
+                    indices.append(k)
+            self._bulk_reads_cache = list(groups.values())
+        return self._bulk_reads_cache
+
+    def _measure_into(self, out: List) -> List:
+        '''Append the measured values to out and return it.'''
+        bulk_reads = self._bulk_reads()
+        if not bulk_reads:
+            for p, gain in self._params:
+                out.append(p() / gain)
+            return out
+
+        values = [_NOT_READ] * len(self._params)
+        for instrument, names, indices in bulk_reads:
+            for k, value in zip(indices, instrument.bulk_read(names)):
+                values[k] = value
+        for k, (p, gain) in enumerate(self._params):
+            if values[k] is _NOT_READ:
+                values[k] = p()
+            values[k] /= gain
+        out.extend(values)
+        return out
+
+    def _measure_traces(self, delay: float=0.0) -> np.ndarray:
+        '''Read all followed traces into one array with a row per frequency point.
+
+        Each trace fills the columns I, Q and, if it was followed with
+        store_magnitude, the noise from magnitude_db. Waits delay seconds
+        after each trace.
+        '''
+        traces_points = None
+        col = 0
+        for trace, _, store_magnitude in self._traces:
+            trace.set_as_active()
+            i_data, q_data = trace.iq_trace.get()
+            if traces_points is None:
+                traces_points = np.empty((len(i_data), len(self._trace_cols)), dtype=i_data.dtype)
+            traces_points[:, col] = i_data
+            traces_points[:, col + 1] = q_data
+            if store_magnitude:
+                magnitude_db(i_data, q_data, out=traces_points[:, col + 2])
+                col += 3
+            else:
+                col += 2
+            self._sleep(delay)
+        return traces_points
 
     def _col_names(self) -> List[str]:
-        if not self._traces:
-            return [p.full_name for p, _ in self._params]
-        elif self._traces:
-            return [p.full_name for p, _ in self._params] + self._trace_cols
+        if self._col_names_cache is None:
+            self._col_names_cache = [p.full_name for p, _ in self._params] + self._trace_cols
+        return list(self._col_names_cache)
+
+    def _collect_instrument_metadata(self, w):
+        '''Store the instruments used and their relevant settings in w.metadata.'''
+        # The first followed parameter of each instrument, in the order they
+        # were followed. Parameters without an instrument are listed as 'None'.
+        instruments = {}
+        for instrument_name, (p, _) in zip(self._instrument_names, self._params):
+            instruments.setdefault(instrument_name, getattr(p, 'instrument', None))
+        w.metadata['instruments used'] = list(instruments)
+
+        for instrument_name, instrument in instruments.items():
+            if "ZM2376" in instrument_name:
+                calibrations = [f"Short Correction State: {instrument.short_correction_state.get()}", 
+                                f"Open Correction State: {instrument.open_correction_state.get()}", 
+                                f"Load Correction State: {instrument.load_correction_state.get()}"]
+                w.metadata[f"calibrations ({instrument_name})"] = calibrations
+                variables = [f"Primary Parameter: {instrument.primary_var.get().strip()}",
+                             f"Secondar Parameter: {instrument.secondary_var.get().strip()}"]
+                w.metadata[f'variables ({instrument_name})'] = variables
+
+            if "SR" in instrument_name:
+                w.metadata[f'frequency ({instrument_name})'] = instrument.frequency.get()
+                w.metadata[f'sine out amplitude ({instrument_name})'] = instrument.amplitude.get()
+
+    def _begin_run(self, w, p, kind: str, run_metadata: Dict):
+        '''Store the metadata common to all sweeps plus run_metadata, which
+        must include the columns, and set up the plot.'''
+        if self._notes != "":
+            w.metadata['notes'] = self._notes
+        w.metadata['computer used'] = _HOSTNAME
+        w.metadata['measurement code ran from file'] = self._calling_file_path
+        self._collect_instrument_metadata(w)
+        w.metadata['type'] = kind
+        w.metadata.update(run_metadata)
+        start_time = time.time()
+        w.metadata.update({
+            'interrupted': False,
+            'start_time': start_time,
+            'human_readable start time': time.strftime(_TIME_FORMAT, time.localtime(start_time)),
+        })
+        p.set_cols(w.metadata['columns'])
+
+    def _end_run(self, w, p) -> float:
+        '''Store the end time of a sweep and save and show its plot. Returns
+        the duration of the sweep in seconds.'''
+        end_time = time.time()
+        duration = end_time - w.metadata['start_time']
+        w.metadata.update({
+            'end_time': end_time,
+            'human_readable end time': time.strftime(_TIME_FORMAT, time.localtime(end_time)),
+            'time taken': _sec_to_str(duration),
+        })
+        image = p.send_image()
+        if image is not None:
+            w.add_blob('plot.png', image)
+            display.display(display.Image(data=image, format='png'))
+        return duration
 
     def follow_param(self, param, gain: float=1.0):
         self._params.append((param, gain))
+        self._instrument_names.append(str(getattr(param, 'instrument', None)))
+        self._col_names_cache = None
+        self._bulk_reads_cache = None
         return self
     
-    def follow_trace(self, trace, gain: float=1.0):
-        self._traces.append((trace, gain))
+    def follow_trace(self, trace, gain: float=1.0, store_magnitude: bool=True):
+        '''Follow a VNA trace in the VNA sweeps.
+
+        The I and Q data are stored, and with store_magnitude also the
+        noise in dB. Without it, compute the noise later with magnitude_db.
+        '''
+        self._traces.append((trace, gain, store_magnitude))
+        self._trace_infos[trace._trace_name] = trace._s_param
+        self._col_names_cache = None
         trac_nam = trace._trace_name
         chan_name = trace._channel_name
         self._trace_cols.append(f'znle.{chan_name.lower()}.{trac_nam.lower()}_i')
         self._trace_cols.append(f'znle.{chan_name.lower()}.{trac_nam.lower()}_q')
-        self._trace_cols.append(f'znle.{chan_name.lower()}.{trac_nam.lower()}')
+        if store_magnitude:
+            self._trace_cols.append(f'znle.{chan_name.lower()}.{trac_nam.lower()}')
         return self
     
     def add_notes(self, note: str):
@@ -121,7 +343,7 @@ class Station:
             w.metadata['columns'] = ['time'] + self._col_names()
             t = time.time()
             w.metadata['time'] = t
-            w.add_point([t] + self._measure())
+            w.add_point(self._measure_into([t]))
         self._print(f'Data saved in {w.datapath}')
         return SweepResult(self._basedir, w.id, w.metadata, w.datapath)
 
@@ -137,14 +359,15 @@ class Station:
             w.metadata['start_time'] = time.time()
             p.set_cols(w.metadata['columns'])
             t_start = time.monotonic() # Can't go backwards!
-            while max_duration is None or time.monotonic() - t_start < max_duration:
-                time.sleep(delay)
-                data = [time.time()] + self._measure()
-                w.add_point(data)
-                p.add_point(data)
-                if self.interrupt_requested:
-                    w.metadata['interrupted'] = True
-                    break
+            with _RowBatch(w) as batch:
+                while max_duration is None or time.monotonic() - t_start < max_duration:
+                    self._sleep(delay)
+                    data = self._measure_into([time.time()])
+                    batch.add_point(data)
+                    p.add_point(data)
+                    if self.interrupt_requested:
+                        w.metadata['interrupted'] = True
+                        break
             w.metadata['end_time'] = time.time()
             image = p.send_image()
             if image is not None:
@@ -163,67 +386,25 @@ class Station:
             self._print(f'Starting run with ID {w.id}')
             self._print(f'Minimum duration {_sec_to_str(len(setpoints) * delay)}')
 
-            instruments_used = []
-            param_indices = []
-            for i in range(len(self._params)):
-                instrument = str(self._params[i][0].instrument)
-                if instrument not in instruments_used:
-                    instruments_used.append(instrument)
-                    param_indices.append(i)
-            
-            if self._notes != "":
-                w.metadata['notes'] = self._notes
-            
-            w.metadata['computer used'] = socket.gethostname()
-         
-            w.metadata['measurement code ran from file'] = self._calling_file_path
-            w.metadata['instruments used'] = instruments_used
-            w.metadata['type'] = '1D'
-            w.metadata['delay'] = delay
-            w.metadata['param'] = param.full_name
-            w.metadata['columns'] = ['time', param.full_name] + self._col_names()
-            
-            for i in range(len(instruments_used)):
-                instrument_name = instruments_used[i]
-                if "ZM2376" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    calibrations = [f"Short Correction State: {instrument.short_correction_state.get()}", 
-                                    f"Open Correction State: {instrument.open_correction_state.get()}", 
-                                    f"Load Correction State: {instrument.load_correction_state.get()}"]
-                    w.metadata[f"calibrations ({instrument_name})"] = calibrations
-                    variables = [f"Primary Parameter: {instrument.primary_var.get().strip()}",
-                                 f"Secondar Parameter: {instrument.secondary_var.get().strip()}"]
-                    w.metadata[f'variables ({instrument_name})'] = variables
-
-                if "SR" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    w.metadata[f'frequency ({instrument_name})'] = instrument.frequency.get()
-                    w.metadata[f'sine out amplitude ({instrument_name})'] = instrument.amplitude.get()
-
-            w.metadata['setpoints'] = list(setpoints)
-            w.metadata['interrupted'] = False
-            w.metadata['start_time'] = time.time()
-            w.metadata['human_readable start time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            p.set_cols(w.metadata['columns'])
-
-            for setpoint in setpoints:
-                param(setpoint)
-                time.sleep(delay) # TODO: Account for time spent in between?
-                data = [time.time(), setpoint] + self._measure()
-                w.add_point(data)
-                p.add_point(data)
-                if self.interrupt_requested:
-                    w.metadata['interrupted'] = True
-                    break
+            self._begin_run(w, p, '1D', {
+                'delay': delay,
+                'param': param.full_name,
+                'columns': ['time', param.full_name] + self._col_names(),
+                'setpoints': np.asarray(setpoints).tolist(),
+            })
+
+            with _RowBatch(w) as batch:
+                for setpoint in setpoints:
+                    param(setpoint)
+                    self._sleep(delay) # TODO: Account for time spent in between?
+                    data = self._measure_into([time.time(), setpoint])
+                    batch.add_point(data)
+                    p.add_point(data)
+                    if self.interrupt_requested:
+                        w.metadata['interrupted'] = True
+                        break
 
-            w.metadata['end_time'] = time.time()
-            w.metadata['human_readable end time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            duration = w.metadata['end_time'] - w.metadata['start_time']
-            w.metadata['time taken'] = str(_sec_to_str(duration))
-            image = p.send_image()
-            if image is not None:
-                w.add_blob('plot.png', image)
-                display.display(display.Image(data=image, format='png'))
+            duration = self._end_run(w, p)
 
         self._print(f'Completed in {_sec_to_str(duration)}')
         self._print(f'Data saved in {w.datapath}')
@@ -237,81 +418,38 @@ class Station:
             min_duration = len(slow_v) * len(fast_v) * fast_delay + len(slow_v) * slow_delay
             self._print(f'Minimum duration {_sec_to_str(min_duration)}')
 
-            instruments_used = []
-            param_indices = []
-            for i in range(len(self._params)):
-                instrument = str(self._params[i][0].instrument)
-                if instrument not in instruments_used:
-                    instruments_used.append(instrument)
-                    param_indices.append(i)
-            
-            if self._notes != "":
-                w.metadata['notes'] = self._notes
-            
-            w.metadata['computer used'] = socket.gethostname()
-         
-            w.metadata['measurement code ran from file'] = self._calling_file_path
-            w.metadata['instruments used'] = instruments_used
-
-            w.metadata['type'] = '2D'
-            w.metadata['slow_delay'] = slow_delay
-            w.metadata['fast_delay'] = fast_delay
-            w.metadata['slow_param'] = slow_param.full_name
-            w.metadata['fast_param'] = fast_param.full_name
-            w.metadata['columns'] = ['time', slow_param.full_name, fast_param.full_name] + self._col_names()
-
-            for i in range(len(instruments_used)):
-                instrument_name = instruments_used[i]
-                if "ZM2376" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    calibrations = [f"Short Correction State: {instrument.short_correction_state.get()}", 
-                                    f"Open Correction State: {instrument.open_correction_state.get()}", 
-                                    f"Load Correction State: {instrument.load_correction_state.get()}"]
-                    w.metadata[f"calibrations ({instrument_name})"] = calibrations
-                    variables = [f"Primary Parameter: {instrument.primary_var.get().strip()}",
-                                 f"Secondar Parameter: {instrument.secondary_var.get().strip()}"]
-                    w.metadata[f'variables ({instrument_name})'] = variables
-
-                if "SR" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    w.metadata[f'frequency ({instrument_name})'] = instrument.frequency.get()
-                    w.metadata[f'sine out amplitude ({instrument_name})'] = instrument.amplitude.get()
-
-            w.metadata['slow_setpoints'] = list(slow_v)
-            w.metadata['fast_setpoints'] = list(fast_v)
-            w.metadata['interrupted'] = False
-            w.metadata['start_time'] = time.time()
-            w.metadata['human_readable start time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            p.set_cols(w.metadata['columns'])
-
-            for i in range(len(slow_v)):
-                ov = slow_v[i]
-                slow_param(ov)
-                time.sleep(slow_delay)
-                for j in range(len(fast_v)):
-                    iv = fast_v[j]
-                    fast_param(iv)
-                    time.sleep(fast_delay)
-                    data = [time.time(), ov, iv] + self._measure()
-                    w.add_point(data)
-                    if j == 0:
-                        p.add_point_to_new_line(data)
-                    else:
-                        p.add_point(data)
+            self._begin_run(w, p, '2D', {
+                'slow_delay': slow_delay,
+                'fast_delay': fast_delay,
+                'slow_param': slow_param.full_name,
+                'fast_param': fast_param.full_name,
+                'columns': ['time', slow_param.full_name, fast_param.full_name] + self._col_names(),
+                'slow_setpoints': np.asarray(slow_v).tolist(),
+                'fast_setpoints': np.asarray(fast_v).tolist(),
+            })
+
+            with _RowBatch(w) as batch:
+                for i in range(len(slow_v)):
+                    ov = slow_v[i]
+                    slow_param(ov)
+                    self._sleep(slow_delay)
+                    for j in range(len(fast_v)):
+                        iv = fast_v[j]
+                        fast_param(iv)
+                        self._sleep(fast_delay)
+                        data = self._measure_into([time.time(), ov, iv])
+                        batch.add_point(data)
+                        if j == 0:
+                            p.add_point_to_new_line(data)
+                        else:
+                            p.add_point(data)
+                        if self.interrupt_requested:
+                            w.metadata['interrupted'] = True
+                            break
                     if self.interrupt_requested:
-                        w.metadata['interrupted'] = True
                         break
-                if self.interrupt_requested:
-                    break
 
-            w.metadata['end_time'] = time.time()
-            w.metadata['human_readable end time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            duration = w.metadata['end_time'] - w.metadata['start_time']
-            w.metadata['time taken'] = str(_sec_to_str(duration))
-            image = p.send_image()
-            if image is not None:
-                w.add_blob('plot.png', image)
-                display.display(display.Image(data=image, format='png'))
+            duration = self._end_run(w, p)
 
         self._print(f'Completed in {_sec_to_str(duration)}')
         self._print(f'Data saved in {w.datapath}')
@@ -321,103 +459,42 @@ class Station:
     @_interruptible
     def sweep_vna_1d(self, delay: float=0.0):
         with db.Writer(self._basedir) as w, self._plotter as p:
-            instruments_used = []
-            param_indices = []
-            for i in range(len(self._params)):
-                instrument = str(self._params[i][0].instrument)
-                if instrument not in instruments_used:
-                    instruments_used.append(instrument)
-                    param_indices.append(i)
-
             fast_param = 'znle_frequency'
             fast_v = self._traces[0][0].root_instrument.params.get_freq_setpoints()
 
-            trace_infos = {trace[0]._trace_name : trace[0]._s_param for trace in self._traces}
-
             self._print(f'Starting run with ID {w.id}')
-            min_duration = len(trace_infos.keys()) * (1 + delay)
+            min_duration = len(self._trace_infos) * (1 + delay)
             self._print(f'Minimum duration {_sec_to_str(min_duration)}')
-            
-            if self._notes != "":
-                w.metadata['notes'] = self._notes
-            
-            w.metadata['computer used'] = socket.gethostname()
-         
-            w.metadata['measurement code ran from file'] = self._calling_file_path
-            w.metadata['instruments used'] = instruments_used
-
-            w.metadata['type'] = '1D_VNA_Sweep'
-            w.metadata['delay'] = delay
-            w.metadata['trace_information'] = trace_infos
-            w.metadata['columns'] = ['time', fast_param] + self._col_names()
-
-            for i in range(len(instruments_used)):
-                instrument_name = instruments_used[i]
-                if "ZM2376" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    calibrations = [f"Short Correction State: {instrument.short_correction_state.get()}", 
-                                    f"Open Correction State: {instrument.open_correction_state.get()}", 
-                                    f"Load Correction State: {instrument.load_correction_state.get()}"]
-                    w.metadata[f"calibrations ({instrument_name})"] = calibrations
-                    variables = [f"Primary Parameter: {instrument.primary_var.get().strip()}",
-                                 f"Secondar Parameter: {instrument.secondary_var.get().strip()}"]
-                    w.metadata[f'variables ({instrument_name})'] = variables
-
-                if "SR" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    w.metadata[f'frequency ({instrument_name})'] = instrument.frequency.get()
-                    w.metadata[f'sine out amplitude ({instrument_name})'] = instrument.amplitude.get()
-
-            w.metadata['znle_freq_setpoints'] = list(fast_v)
-            w.metadata['interrupted'] = False
-            w.metadata['start_time'] = time.time()
-            w.metadata['human_readable start time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            p.set_cols(w.metadata['columns'])
-
-            traces_data = []
-            traces_name = []
 
-            for trace in self._traces:
-                gain = trace[1]
-                trace = trace[0]
-                trace.set_as_active()
-                raw_data = trace.iq_trace.get()
+            self._begin_run(w, p, '1D_VNA_Sweep', {
+                'delay': delay,
+                'trace_information': dict(self._trace_infos),
+                'columns': ['time', fast_param] + self._col_names(),
+                'znle_freq_setpoints': np.asarray(fast_v).tolist(),
+            })
 
-                i_data, q_data = raw_data
-                noises = [10 * np.log10(i ** 2 + q ** 2) for i, q in zip(i_data, q_data)]
-                processed_data = [i_data, q_data, noises]
-                processed_data = [point for point in zip(*processed_data)]
-                
-                traces_data.append(processed_data)
-                traces_name.append(trace._trace_name)
-
-                time.sleep(delay)
-
-            traces_points = [a + b for a, b in zip(*traces_data)]
+            traces_points = self._measure_traces(delay)
             
             self._traces_points = traces_points
 
+            # The whole trace is already in memory, so it goes to the writer
+            # and the plotter in one call each.
+            rows = []
             for j in range(len(traces_points)):
 
                 point_data = traces_points[j]
                 iv = fast_v[j]
-                data = [time.time(), iv] + self._measure()
+                data = self._measure_into([time.time(), iv])
                 data.extend(point_data)
-                w.add_point(data)
-                p.add_point(data)
+                rows.append(data)
                 
                 if self.interrupt_requested:
                     w.metadata['interrupted'] = True
                     break
+            w.add_points(rows)
+            p.add_points(rows)
 
-            w.metadata['end_time'] = time.time()
-            w.metadata['human_readable end time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            duration = w.metadata['end_time'] - w.metadata['start_time']
-            w.metadata['time taken'] = str(_sec_to_str(duration))
-            image = p.send_image()
-            if image is not None:
-                w.add_blob('plot.png', image)
-                display.display(display.Image(data=image, format='png'))
+            duration = self._end_run(w, p)
 
         self._print(f'Completed in {_sec_to_str(duration)}')
         self._print(f'Data saved in {w.datapath}')
@@ -428,118 +505,60 @@ class Station:
     @_interruptible
     def sweep_vna_2d(self, slow_param, slow_v, slow_delay=0):
         with db.Writer(self._basedir) as w, self._plotter as p:
-            instruments_used = []
-            param_indices = []
-            for i in range(len(self._params)):
-                instrument = str(self._params[i][0].instrument)
-                if instrument not in instruments_used:
-                    instruments_used.append(instrument)
-                    param_indices.append(i)
-
             fast_param = 'znle_frequency'
             fast_v = self._traces[0][0].root_instrument.params.get_freq_setpoints()
             fast_delay = 0
 
-            trace_infos = {trace[0]._trace_name : trace[0]._s_param for trace in self._traces}
-
             self._print(f'Starting run with ID {w.id}')
             min_duration = len(slow_v) * len(fast_v) * fast_delay + len(slow_v) * slow_delay
             self._print(f'Minimum duration {_sec_to_str(min_duration)}')
-            
-            if self._notes != "":
-                w.metadata['notes'] = self._notes
-            
-            w.metadata['computer used'] = socket.gethostname()
-         
-            w.metadata['measurement code ran from file'] = self._calling_file_path
-            w.metadata['instruments used'] = instruments_used
-
-            w.metadata['type'] = '2D_VNA_Sweep'
-            w.metadata['slow_delay'] = slow_delay
-            w.metadata['fast_delay'] = fast_delay
-            w.metadata['slow_param'] = slow_param.full_name
-            w.metadata['fast_param'] = fast_param
-            w.metadata['trace_information'] = trace_infos
-            w.metadata['columns'] = ['time', slow_param.full_name, fast_param] + self._col_names()
-
-            for i in range(len(instruments_used)):
-                instrument_name = instruments_used[i]
-                if "ZM2376" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    calibrations = [f"Short Correction State: {instrument.short_correction_state.get()}", 
-                                    f"Open Correction State: {instrument.open_correction_state.get()}", 
-                                    f"Load Correction State: {instrument.load_correction_state.get()}"]
-                    w.metadata[f"calibrations ({instrument_name})"] = calibrations
-                    variables = [f"Primary Parameter: {instrument.primary_var.get().strip()}",
-                                 f"Secondar Parameter: {instrument.secondary_var.get().strip()}"]
-                    w.metadata[f'variables ({instrument_name})'] = variables
-
-                if "SR" in instrument_name:
-                    instrument = self._params[param_indices[i]][0].instrument
-                    w.metadata[f'frequency ({instrument_name})'] = instrument.frequency.get()
-                    w.metadata[f'sine out amplitude ({instrument_name})'] = instrument.amplitude.get()
-
-            w.metadata['slow_setpoints'] = list(slow_v)
-            w.metadata['fast_setpoints'] = list(fast_v)
-            w.metadata['interrupted'] = False
-            w.metadata['start_time'] = time.time()
-            w.metadata['human_readable start time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            p.set_cols(w.metadata['columns'])
+
+            self._begin_run(w, p, '2D_VNA_Sweep', {
+                'slow_delay': slow_delay,
+                'fast_delay': fast_delay,
+                'slow_param': slow_param.full_name,
+                'fast_param': fast_param,
+                'trace_information': dict(self._trace_infos),
+                'columns': ['time', slow_param.full_name, fast_param] + self._col_names(),
+                'slow_setpoints': np.asarray(slow_v).tolist(),
+                'fast_setpoints': np.asarray(fast_v).tolist(),
+            })
 
             for i in range(len(slow_v)):
                 ov = slow_v[i]
                 slow_param(ov)
-                time.sleep(slow_delay)
+                self._sleep(slow_delay)
 
                 slow_measurement = self._measure()
 
-                traces_data = []
-                traces_name = []
-
-                for trace in self._traces:
-                    gain = trace[1]
-                    trace = trace[0]
-                    trace.set_as_active()
-                    raw_data = trace.iq_trace.get()
-
-                    i_data, q_data = raw_data
-                    noises = [10 * np.log10(i ** 2 + q ** 2) for i, q in zip(i_data, q_data)]
-                    processed_data = [i_data, q_data, noises]
-                    processed_data = [point for point in zip(*processed_data)]
-                    
-                    traces_data.append(processed_data)
-                    traces_name.append(trace._trace_name)
-
-                traces_points = [a + b for a, b in zip(*traces_data)]
+                traces_points = self._measure_traces()
+                # Every point of the acquisition comes from the same slow step, so they share one timestamp.
+                t_capture = time.time()
                 
                 self._traces_points = traces_points
 
+                # The whole trace is already in memory, so it goes to the writer
+                # and the plotter in one call each.
+                rows = []
                 for j in range(len(traces_points)):
 
                     point_data = traces_points[j]
                     iv = fast_v[j]
-                    data = [time.time(), ov, iv] + slow_measurement
+                    data = [t_capture, ov, iv] + slow_measurement
                     data.extend(point_data)
-                    w.add_point(data)
-                    if j == 0:
-                        p.add_point_to_new_line(data)
-                    else:
-                        p.add_point(data)
+                    rows.append(data)
                     
                     if self.interrupt_requested:
                         w.metadata['interrupted'] = True
                         break
+                w.add_points(rows)
+                if rows:
+                    p.add_point_to_new_line(rows[0])
+                    p.add_points(rows[1:])
                 if self.interrupt_requested:
                     break
 
-            w.metadata['end_time'] = time.time()
-            w.metadata['human_readable end time'] = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-            duration = w.metadata['end_time'] - w.metadata['start_time']
-            w.metadata['time taken'] = str(_sec_to_str(duration))
-            image = p.send_image()
-            if image is not None:
-                w.add_blob('plot.png', image)
-                display.display(display.Image(data=image, format='png'))
+            duration = self._end_run(w, p)
 
         self._print(f'Completed in {_sec_to_str(duration)}')
         self._print(f'Data saved in {w.datapath}')
@@ -1,7 +1,11 @@
+import signal
 import tempfile
+import types
 import unittest
 
-import sweep
+import numpy as np
+
+from . import sweep
 from . import db as db
 
 
@@ -15,6 +19,55 @@ class _DummyParam:
             return self._v
 
 
+class _BulkInstrument:
+    '''An instrument that reads several parameters at once.'''
+    def __init__(self, name: str, values):
+        self.name = name
+        self.values = values
+        self.bulk_reads = []
+
+    def __str__(self):
+        return self.name
+
+    def bulk_read(self, param_names):
+        self.bulk_reads.append(list(param_names))
+        return [self.values[name] for name in param_names]
+
+
+class _InstrumentParam:
+    def __init__(self, instrument: _BulkInstrument, name: str):
+        self.instrument = instrument
+        self.name = name
+        self.full_name = f'{instrument.name}_{name}'
+
+    def __call__(self):
+        raise AssertionError(f'{self.full_name} should be read through bulk_read')
+
+
+class _InterruptingParam:
+    '''Sends a SIGINT when set to the setpoint interrupt_at.'''
+    def __init__(self, full_name: str, interrupt_at):
+        self.full_name = full_name
+        self._interrupt_at = interrupt_at
+
+    def __call__(self, sp=None):
+        if sp == self._interrupt_at:
+            signal.raise_signal(signal.SIGINT)
+
+
+class _DummyTrace:
+    def __init__(self, trace_num: int, i, q):
+        self._trace_name = f'Trc{trace_num}'
+        self._channel_name = 'Ch1'
+        self._s_param = 'S21'
+        self.iq_trace = types.SimpleNamespace(get=lambda: (np.array(i), np.array(q)))
+        params = types.SimpleNamespace(get_freq_setpoints=lambda: np.linspace(1e9, 2e9, len(i)))
+        self.root_instrument = types.SimpleNamespace(params=params)
+
+    def set_as_active(self):
+        pass
+
+
 class TestStation(unittest.TestCase):
     def setUp(self):
         self.dir = tempfile.TemporaryDirectory()
@@ -33,6 +86,15 @@ class TestStation(unittest.TestCase):
             self.assertEqual(len(r.all_data()), 1)
             self.assertEqual(float(r.all_data()[0][1]), 1.0)
 
+    def test_watch(self):
+        s = sweep.Station(basedir=self.dir.name, verbose=True)
+        s.fp(_DummyParam('p2', 1.0))
+        res = s.watch(max_duration=0.2)
+        with db.Reader(res.basedir, res.id) as r:
+            self.assertEqual(r.metadata['type'], '1D')
+            self.assertEqual(r.metadata['columns'][1], 'p2')
+            self.assertTrue(len(r.all_data()) > 0)
+
     def test_sweep(self):
         s = sweep.Station(basedir=self.dir.name, verbose=True)
         s.fp(_DummyParam('p2', 1.0)).fp(_DummyParam('p3', 2.0))
@@ -44,6 +106,7 @@ class TestStation(unittest.TestCase):
             self.assertEqual(r.metadata['columns'][1], 'p1')
             self.assertEqual(r.metadata['columns'][2], 'p2')
             self.assertEqual(r.metadata['columns'][3], 'p3')
+            self.assertEqual(r.metadata['instruments used'], ['None'])
             self.assertEqual(len(r.all_data()), 1000)
 
     def test_sweep_plot(self):
@@ -55,6 +118,89 @@ class TestStation(unittest.TestCase):
             self.assertEqual(len(r.all_data()), 10)
             self.assertTrue(len(r.blob('plot.png')) > 0)
 
+    def test_sweep_vna_2d_empty_trace(self):
+        s = sweep.Station(basedir=self.dir.name, verbose=True)
+        s.follow_trace(_DummyTrace(1, [], []))
+        res = s.sweep_vna_2d(_DummyParam('p1', None), range(3))
+        with db.Reader(res.basedir, res.id) as r:
+            self.assertFalse(r.metadata['interrupted'])
+            self.assertEqual(len(r.all_data()), 0)
+
+    def test_bulk_read(self):
+        lcr = _BulkInstrument('lcr', {'primary': 2.0, 'secondary': 3.0})
+        other = _BulkInstrument('other', {'x': 5.0})
+        s = sweep.Station(basedir=self.dir.name, verbose=True)
+        s.fp(_InstrumentParam(lcr, 'secondary'), gain=2.0).fp(_DummyParam('p', 7.0))
+        s.fp(_InstrumentParam(other, 'x')).fp(_InstrumentParam(lcr, 'primary'))
+        res = s.sweep(_DummyParam('p1', None), range(3))
+        with db.Reader(res.basedir, res.id) as r:
+            self.assertEqual(r.metadata['columns'][2:], ['lcr_secondary', 'p', 'other_x', 'lcr_primary'])
+            self.assertEqual(r.metadata['instruments used'], ['lcr', 'None', 'other'])
+            data = np.array(r.all_data(), dtype=float)
+        np.testing.assert_allclose(data[:, 2:], [[1.5, 7.0, 5.0, 2.0]] * 3)
+        # One read per instrument and point, with the parameters in the order they were followed.
+        self.assertEqual(lcr.bulk_reads, [['secondary', 'primary']] * 3)
+        self.assertEqual(other.bulk_reads, [['x']] * 3)
+
+        # Following another parameter regroups the reads.
+        other.values['y'] = 6.0
+        s.fp(_InstrumentParam(other, 'y'))
+        res = s.measure()
+        self.assertEqual(other.bulk_reads[-1], ['x', 'y'])
+        with db.Reader(res.basedir, res.id) as r:
+            np.testing.assert_allclose(np.array(r.all_data()[0][1:], dtype=float), [1.5, 7.0, 5.0, 2.0, 6.0])
+
+    def test_sweep_interrupt(self):
+        self.addCleanup(signal.signal, signal.SIGINT, signal.getsignal(signal.SIGINT))
+        s = sweep.Station(basedir=self.dir.name, verbose=True)
+        s.fp(_DummyParam('p2', 1.0))
+        res = s.sweep(_InterruptingParam('p1', 3), range(10), delay=0.01)
+        with db.Reader(res.basedir, res.id) as r:
+            self.assertTrue(r.metadata['interrupted'])
+            self.assertEqual(len(r.all_data()), 4)
+
+        # The handler stays installed, but outside of a sweep Ctrl-C interrupts as usual.
+        self.assertIs(signal.getsignal(signal.SIGINT), sweep._sigint_handler)
+        with self.assertRaises(KeyboardInterrupt):
+            signal.raise_signal(signal.SIGINT)
+
+        res = s.sweep(_InterruptingParam('p1', None), range(10))
+        with db.Reader(res.basedir, res.id) as r:
+            self.assertFalse(r.metadata['interrupted'])
+            self.assertEqual(len(r.all_data()), 10)
+
+    def test_row_batch(self):
+        with db.Writer(self.dir.name) as w:
+            with sweep._RowBatch(w) as batch:
+                for k in range(sweep._BATCH_ROWS + 1):
+                    batch.add_point([k])
+                # A full batch is written right away, the rest waits.
+                self.assertEqual(len(batch._rows), 1)
+        with db.Reader(self.dir.name, w.id) as r:
+            self.assertEqual([int(row[0]) for row in r.all_data()], list(range(sweep._BATCH_ROWS + 1)))
+
+    def test_magnitude_db(self):
+        i, q = np.array([3.0, 1e-200, 1e200]), np.array([4.0, 0.0, 1e200])
+        np.testing.assert_allclose(sweep.magnitude_db(i, q),
+                                   [10 * np.log10(25), -4000, 4000 + 10 * np.log10(2)])
+        out = np.empty(3)
+        self.assertIs(sweep.magnitude_db(i, q, out=out), out)
+
+    def test_sweep_vna_1d_store_magnitude(self):
+        s = sweep.Station(basedir=self.dir.name, verbose=True)
+        s.fp(_DummyParam('p2', 1.0))
+        s.follow_trace(_DummyTrace(1, [3.0, 1.0], [4.0, 0.0]))
+        s.follow_trace(_DummyTrace(2, [5.0, 6.0], [7.0, 8.0]), store_magnitude=False)
+        res = s.sweep_vna_1d()
+        with db.Reader(res.basedir, res.id) as r:
+            self.assertEqual(r.metadata['columns'], [
+                'time', 'znle_frequency', 'p2', 'znle.ch1.trc1_i', 'znle.ch1.trc1_q', 'znle.ch1.trc1',
+                'znle.ch1.trc2_i', 'znle.ch1.trc2_q'])
+            self.assertEqual(r.metadata['trace_information'], {'Trc1': 'S21', 'Trc2': 'S21'})
+            data = np.array(r.all_data(), dtype=float)
+        np.testing.assert_allclose(data[:, 1], [1e9, 2e9])
+        np.testing.assert_allclose(data[:, 3:], [[3, 4, 10 * np.log10(25), 5, 7], [1, 0, 0, 6, 8]])
+
 
 if __name__ == '__main__':
     unittest.main()